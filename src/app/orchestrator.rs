@@ -25,14 +25,21 @@ pub struct Orchestrator {
     config: Config,
     http_client: Arc<HttpClient>,
     override_auth: Option<Auth>,
+    /// 最近一次保存的封面 (视频ID, 输出路径)。多P视频共用同一封面，
+    /// 后续分P直接从已保存的文件复制，不再重复下载
+    saved_cover: tokio::sync::Mutex<Option<(String, PathBuf)>>,
 }
 
 impl Orchestrator {
     pub fn new(config: Config, cli: &Cli) -> Result<Self> {
-        let http_client = Arc::new(HttpClient::new()?);
-        
+        Self::with_http_client(config, cli, Arc::new(HttpClient::new()?))
+    }
+
+    /// 复用已有的HTTP客户端构建Orchestrator（如登录后继续下载时共享连接池）
+    pub fn with_http_client(config: Config, cli: &Cli, http_client: Arc<HttpClient>) -> Result<Self> {
+
         // Configure downloader with aria2c settings
-        let mut downloader = Downloader::new(http_client.clone(), cli.threads);
+        let mut downloader = Downloader::new(http_client.clone(), cli.effective_threads(&config));
         
         // Determine download method from CLI or config
         let use_aria2c = cli.use_aria2c 
@@ -64,19 +71,21 @@ impl Orchestrator {
         
         let downloader = Arc::new(downloader);
         
-        let muxer =
-            Arc::new(Muxer::new_with_options(
-                cli.ffmpeg_path.clone().or_else(|| {
-                    config.paths.as_ref().and_then(|p| p.ffmpeg.clone())
-                }),
-                cli.use_mp4box,
-            )?);
+        let ffmpeg_path = cli.ffmpeg_path.clone().or_else(|| {
+            config.paths.as_ref().and_then(|p| p.ffmpeg.clone())
+        });
+        // info-only 和 skip-mux 运行不会调用 ffmpeg，跳过启动时的探测
+        let muxer = if cli.info_only || cli.skip_mux {
+            Arc::new(Muxer::new_unchecked(ffmpeg_path, cli.use_mp4box))
+        } else {
+            Arc::new(Muxer::new_with_options(ffmpeg_path, cli.use_mp4box)?)
+        };
         let progress = Arc::new(ProgressTracker::new());
 
         // 根据CLI参数选择API模式
         let api_mode = cli.get_api_mode();
         let platforms: Vec<Box<dyn Platform>> = vec![
-            Box::new(BilibiliPlatform::with_api_mode(api_mode)?)
+            Box::new(BilibiliPlatform::with_client(http_client.clone(), api_mode))
         ];
 
         Ok(Self {
@@ -87,6 +96,7 @@ impl Orchestrator {
             config,
             http_client,
             override_auth: None,
+            saved_cover: tokio::sync::Mutex::new(None),
         })
     }
 
@@ -95,6 +105,23 @@ impl Orchestrator {
         self.override_auth = auth;
     }
 
+    /// Build a downloader carrying the session auth once per run, instead of
+    /// reconstructing it for every page
+    fn downloader_with_auth(&self, auth: Option<&Auth>) -> Arc<Downloader> {
+        if auth.is_none() {
+            return self.downloader.clone();
+        }
+
+        let mut downloader = Downloader::new(self.http_client.clone(), self.downloader.thread_count)
+            .with_method(self.downloader.method)
+            .with_aria2c_path(self.downloader.aria2c_path.clone())
+            .with_auth(auth.cloned());
+        if let Some(ref args) = self.downloader.aria2c_args {
+            downloader = downloader.with_aria2c_args(args.clone());
+        }
+        Arc::new(downloader)
+    }
+
     fn select_platform(&self, url: &str) -> Result<&dyn Platform> {
         for platform in &self.platforms {
             if platform.can_handle(url) {
@@ -107,10 +134,17 @@ impl Orchestrator {
 
     fn is_batch_url(&self, url: &str) -> bool {
         // Check if URL is a batch download type (favorites, space, medialist, series)
-        url.contains("favlist") 
-            || (url.contains("space.bilibili.com") && !url.contains("/video/"))
-            || url.contains("medialist")
-            || url.contains("seriesdetail")
+        // 无条件的批量特征合成一个预编译正则单趟扫描；
+        // 只有UP主空间需要再排除 /video/ 单视频链接
+        static BATCH_REGEX: std::sync::OnceLock<regex::Regex> = std::sync::OnceLock::new();
+        if BATCH_REGEX
+            .get_or_init(|| regex::Regex::new(r"favlist|medialist|seriesdetail").unwrap())
+            .is_match(url)
+        {
+            return true;
+        }
+
+        url.contains("space.bilibili.com") && !url.contains("/video/")
     }
 
     pub async fn run(&self, cli: Cli) -> Result<()> {
@@ -124,101 +158,91 @@ impl Orchestrator {
         let platform = self.select_platform(url)?;
         tracing::info!("Using platform: {}", platform.name());
 
-        // Build auth
+        // Build auth and the downloader that carries it (shared by all pages)
         let auth = self.build_auth(&cli);
+        let downloader_with_auth = self.downloader_with_auth(auth.as_ref());
 
         // Check if this is a batch download URL (for bilibili)
-        let is_batch = self.is_batch_url(url);
-        
-        if is_batch {
-            // Handle batch download
-            if let Some(bilibili) = platform.as_any().downcast_ref::<BilibiliPlatform>() {
+        // 批量与单视频共用同一条下载路径，只在解析和提示上区分
+        let batch_platform = if self.is_batch_url(url) {
+            platform.as_any().downcast_ref::<BilibiliPlatform>()
+        } else {
+            None
+        };
+        let is_batch = batch_platform.is_some();
+
+        let videos = match batch_platform {
+            Some(bilibili) => {
                 let videos = bilibili.parse_video_batch(url, auth.as_ref()).await?;
-                
+
                 if videos.is_empty() {
                     return Err(DownloaderError::Parse("No videos found in batch".to_string()));
                 }
-                
+
                 println!("\n📦 Batch download: {} video(s) found", videos.len());
-                
-                if cli.info_only {
-                    for (idx, video) in videos.iter().enumerate() {
-                        println!("\n[{}/{}]", idx + 1, videos.len());
-                        self.display_video_info(video);
-                    }
-                    return Ok(());
-                }
-                
-                // Build stream preferences
-                let preferences = StreamPreferences {
-                    quality_priority: cli.parse_quality_priority(),
-                    codec_priority: cli.parse_codec_priority(),
-                };
-                
-                // Download each video in the batch
-                for (idx, video_info) in videos.iter().enumerate() {
-                    println!("\n[{}/{}] Processing: {}", idx + 1, videos.len(), video_info.title);
-                    
-                    // Determine which pages to download
-                    let pages_to_download = self.select_pages(video_info, &cli)?;
-                    
-                    // Download each page
-                    for page in pages_to_download {
-                        self.process_page(
-                            video_info,
-                            &page,
-                            &preferences,
-                            &cli,
-                            platform,
-                            auth.as_ref(),
-                        )
-                        .await?;
-                    }
-                }
-                
-                self.progress.finish_all();
-                println!("\n✓ All {} video(s) downloaded successfully!", videos.len());
-                
-                return Ok(());
+                videos
             }
-        }
+            None => vec![platform.parse_video(url, auth.as_ref()).await?],
+        };
 
-        // Single video download (original logic)
-        let video_info = platform.parse_video(url, auth.as_ref()).await?;
+        let video_count = videos.len();
 
         // Display video info
-        self.display_video_info(&video_info);
+        if !is_batch {
+            self.display_video_info(&videos[0]);
+        }
 
         if cli.info_only {
+            for (idx, video) in videos.iter().enumerate() {
+                if is_batch {
+                    println!("\n[{}/{}]", idx + 1, video_count);
+                    self.display_video_info(video);
+                }
+            }
             return Ok(());
         }
 
-        // Determine which pages to download
-        let pages_to_download = self.select_pages(&video_info, &cli)?;
-
-        tracing::info!("Will download {} page(s)", pages_to_download.len());
-
         // Build stream preferences
         let preferences = StreamPreferences {
             quality_priority: cli.parse_quality_priority(),
             codec_priority: cli.parse_codec_priority(),
         };
 
-        // Download each page
-        for page in pages_to_download {
-            self.process_page(
-                &video_info,
-                &page,
-                &preferences,
-                &cli,
-                platform,
-                auth.as_ref(),
-            )
-            .await?;
+        // 分P选择只解析一次，每个视频复用
+        let page_selection = cli.parse_pages();
+
+        // Download each video
+        for (idx, video_info) in videos.iter().enumerate() {
+            if is_batch {
+                println!("\n[{}/{}] Processing: {}", idx + 1, video_count, video_info.title);
+            }
+
+            // Determine which pages to download
+            let pages_to_download = self.select_pages(video_info, page_selection.as_deref())?;
+
+            tracing::info!("Will download {} page(s)", pages_to_download.len());
+
+            // Download each page
+            for page in pages_to_download {
+                self.process_page(
+                    video_info,
+                    page,
+                    &preferences,
+                    &cli,
+                    platform,
+                    auth.as_ref(),
+                    &downloader_with_auth,
+                )
+                .await?;
+            }
         }
 
         self.progress.finish_all();
-        println!("\n✓ All downloads completed successfully!");
+        if is_batch {
+            println!("\n✓ All {} video(s) downloaded successfully!", video_count);
+        } else {
+            println!("\n✓ All downloads completed successfully!");
+        }
 
         Ok(())
     }
@@ -232,9 +256,10 @@ impl Orchestrator {
         }
         
         // Try to load from auth.toml if config file is specified
+        // （config.toml的[auth]部分已经解析在self.config里，不再重读一遍文件）
         let auth_from_file = if let Some(ref config_path) = cli.config_file {
             use crate::auth::storage::CredentialStorage;
-            CredentialStorage::load_from_config(config_path)
+            CredentialStorage::load_auth_file(config_path)
                 .ok()
                 .flatten()
                 .map(|creds| CredentialStorage::to_auth(&creds))
@@ -266,30 +291,47 @@ impl Orchestrator {
     }
 
     fn display_video_info(&self, video_info: &VideoInfo) {
-        println!("\n📹 Video Information:");
-        println!("  Title: {}", video_info.title);
-        println!("  Uploader: {}", video_info.uploader);
-        println!("  Pages: {}", video_info.pages.len());
+        use std::fmt::Write;
+
+        // 拼成一个缓冲一次输出，避免逐行println的多次写入
+        let mut info = String::new();
+        let _ = writeln!(info, "\n📹 Video Information:");
+        let _ = writeln!(info, "  Title: {}", video_info.title);
+        let _ = writeln!(info, "  Uploader: {}", video_info.uploader);
+        let _ = writeln!(info, "  Pages: {}", video_info.pages.len());
         if !video_info.description.is_empty() {
-            // 安全地截断字符串，考虑 UTF-8 字符边界
-            let desc = if video_info.description.chars().count() > 100 {
-                let truncated: String = video_info.description.chars().take(100).collect();
-                format!("{}...", truncated)
-            } else {
-                video_info.description.clone()
-            };
-            println!("  Description: {}", desc);
+            // 安全地截断字符串，考虑 UTF-8 字符边界（只扫描前100个字符）
+            match video_info.description.char_indices().nth(100) {
+                Some((byte_pos, _)) => {
+                    let _ = writeln!(
+                        info,
+                        "  Description: {}...",
+                        &video_info.description[..byte_pos]
+                    );
+                }
+                None => {
+                    let _ = writeln!(info, "  Description: {}", video_info.description);
+                }
+            }
         }
-        println!();
+        println!("{}", info);
     }
 
-    fn select_pages(&self, video_info: &VideoInfo, cli: &Cli) -> Result<Vec<Page>> {
-        if let Some(page_numbers) = cli.parse_pages() {
-            // Filter pages by user selection
-            let mut selected = Vec::new();
+    // 返回引用而不是克隆每个Page，选中的分P只在下载时借用
+    // （分P选择字符串由调用方解析一次，批量下载时不重复解析）
+    fn select_pages<'a>(
+        &self,
+        video_info: &'a VideoInfo,
+        page_numbers: Option<&[usize]>,
+    ) -> Result<Vec<&'a Page>> {
+        if let Some(page_numbers) = page_numbers {
+            // Filter pages by user selection (index by number to avoid a scan per selection)
+            let by_number: std::collections::HashMap<_, _> =
+                video_info.pages.iter().map(|p| (p.number, p)).collect();
+            let mut selected = Vec::with_capacity(page_numbers.len());
             for num in page_numbers {
-                if let Some(page) = video_info.pages.iter().find(|p| p.number == num) {
-                    selected.push(page.clone());
+                if let Some(page) = by_number.get(num) {
+                    selected.push(*page);
                 } else {
                     tracing::warn!("Page {} not found, skipping", num);
                 }
@@ -304,20 +346,20 @@ impl Orchestrator {
             Ok(selected)
         } else {
             // Download all pages
-            Ok(video_info.pages.clone())
+            Ok(video_info.pages.iter().collect())
         }
     }
 
     fn interactive_select_streams(&self, streams: &[Stream]) -> Result<(Stream, Stream)> {
-        let video_streams: Vec<&Stream> = streams
-            .iter()
-            .filter(|s| s.stream_type == StreamType::Video)
-            .collect();
-
-        let audio_streams: Vec<&Stream> = streams
-            .iter()
-            .filter(|s| s.stream_type == StreamType::Audio)
-            .collect();
+        // 一次遍历按类型分组，避免对流列表扫两遍
+        let mut video_streams: Vec<&Stream> = Vec::new();
+        let mut audio_streams: Vec<&Stream> = Vec::new();
+        for stream in streams {
+            match stream.stream_type {
+                StreamType::Video => video_streams.push(stream),
+                StreamType::Audio => audio_streams.push(stream),
+            }
+        }
 
         if video_streams.is_empty() {
             return Err(DownloaderError::DownloadFailed(
@@ -374,60 +416,73 @@ impl Orchestrator {
         cli: &Cli,
         platform: &dyn Platform,
         auth: Option<&Auth>,
+        downloader_with_auth: &Arc<Downloader>,
     ) -> Result<()> {
         println!("\n📥 Downloading: P{} - {}", page.number, page.title);
 
+        // aid 在本函数中多次作为字符串使用，只转换一次
+        let aid = video_info.aid.to_string();
+
         // Get chapters early (before downloading)
-        let chapters = match parser::fetch_chapters(
-            &self.http_client,
-            &video_info.aid.to_string(),
-            &page.cid,
-        )
-        .await
-        {
-            Ok(chapters) => {
-                if !chapters.is_empty() {
-                    tracing::debug!("Found {} chapter(s)", chapters.len());
-                }
-                chapters
+        // Chapters are only embedded during muxing, so skip the extra API call with --skip-mux
+        let chapters_fut = async {
+            if cli.skip_mux {
+                return Vec::new();
             }
-            Err(e) => {
-                tracing::debug!("Failed to fetch chapters: {}", e);
-                Vec::new()
+
+            match parser::fetch_chapters(&self.http_client, &aid, &page.cid).await {
+                Ok(chapters) => {
+                    if !chapters.is_empty() {
+                        tracing::debug!("Found {} chapter(s)", chapters.len());
+                    }
+                    chapters
+                }
+                Err(e) => {
+                    tracing::debug!("Failed to fetch chapters: {}", e);
+                    Vec::new()
+                }
             }
         };
 
         // Get streams (use aid for bilibili API)
-        let streams = if video_info.is_bangumi {
-            // 番剧需要使用特殊的API
-            if let Some(platform_bilibili) = platform.as_any().downcast_ref::<crate::platform::bilibili::BilibiliPlatform>() {
-                if let Some(ref ep_id) = page.ep_id {
-                    // 使用page的ep_id（每个episode有自己的ep_id）
-                    platform_bilibili
-                        .get_bangumi_streams(&video_info.aid.to_string(), &page.cid, ep_id, auth)
-                        .await?
-                } else if let Some(ref ep_id) = video_info.ep_id {
-                    // 如果page没有ep_id，使用video_info的ep_id
-                    platform_bilibili
-                        .get_bangumi_streams(&video_info.aid.to_string(), &page.cid, ep_id, auth)
-                        .await?
+        let streams_fut = async {
+            let streams = if video_info.is_bangumi {
+                // 番剧需要使用特殊的API
+                if let Some(platform_bilibili) = platform.as_any().downcast_ref::<crate::platform::bilibili::BilibiliPlatform>() {
+                    if let Some(ref ep_id) = page.ep_id {
+                        // 使用page的ep_id（每个episode有自己的ep_id）
+                        platform_bilibili
+                            .get_bangumi_streams(&aid, &page.cid, ep_id, auth)
+                            .await?
+                    } else if let Some(ref ep_id) = video_info.ep_id {
+                        // 如果page没有ep_id，使用video_info的ep_id
+                        platform_bilibili
+                            .get_bangumi_streams(&aid, &page.cid, ep_id, auth)
+                            .await?
+                    } else {
+                        // 如果都没有ep_id，尝试使用普通API
+                        platform
+                            .get_streams(&aid, &page.cid, auth)
+                            .await?
+                    }
                 } else {
-                    // 如果都没有ep_id，尝试使用普通API
                     platform
-                        .get_streams(&video_info.aid.to_string(), &page.cid, auth)
+                        .get_streams(&aid, &page.cid, auth)
                         .await?
                 }
             } else {
                 platform
-                    .get_streams(&video_info.aid.to_string(), &page.cid, auth)
+                    .get_streams(&aid, &page.cid, auth)
                     .await?
-            }
-        } else {
-            platform
-                .get_streams(&video_info.aid.to_string(), &page.cid, auth)
-                .await?
+            };
+
+            Ok::<_, DownloaderError>(streams)
         };
 
+        // 章节和流信息互不依赖，并发获取
+        let (chapters, streams) = tokio::join!(chapters_fut, streams_fut);
+        let streams = streams?;
+
         if streams.is_empty() {
             return Err(DownloaderError::DownloadFailed(
                 "No streams available".to_string(),
@@ -444,54 +499,60 @@ impl Orchestrator {
         // Create temp directory
         let temp_dir = file::create_temp_dir(&format!("{}_{}", video_info.id, page.cid)).await?;
 
-        // Create a downloader with auth for this download session
-        let downloader_with_auth = if auth.is_some() {
-            // Clone the Arc to get the inner Downloader, then create a new one with auth
-            let mut new_downloader = Downloader::new(self.http_client.clone(), self.downloader.thread_count);
-            new_downloader = new_downloader
-                .with_method(self.downloader.method)
-                .with_aria2c_path(self.downloader.aria2c_path.clone())
-                .with_auth(auth.cloned());
-            if let Some(ref args) = self.downloader.aria2c_args {
-                new_downloader = new_downloader.with_aria2c_args(args.clone());
-            }
-            Arc::new(new_downloader)
-        } else {
-            self.downloader.clone()
-        };
-
-        // Download video
+        // Download video and audio（两条流互不依赖，并发下载，MultiProgress分别显示进度）
         let video_path = temp_dir.join("video.m4s");
-        let video_pb = self.progress.create_bar("Video", 0);
-        downloader_with_auth
-            .download(&video_stream.url, &video_path, Some(video_pb.clone()))
-            .await?;
-        self.progress.finish("Video", "✓ Video downloaded");
-
-        // Download audio
         let audio_path = temp_dir.join("audio.m4s");
+        let video_pb = self.progress.create_bar("Video", 0);
         let audio_pb = self.progress.create_bar("Audio", 0);
-        downloader_with_auth
-            .download(&audio_stream.url, &audio_path, Some(audio_pb.clone()))
-            .await?;
-        self.progress.finish("Audio", "✓ Audio downloaded");
+
+        let video_fut = async {
+            downloader_with_auth
+                .download(&video_stream.url, &video_path, Some(video_pb.clone()))
+                .await?;
+            self.progress.finish("Video", "✓ Video downloaded");
+            Ok::<_, DownloaderError>(())
+        };
+
+        let audio_fut = async {
+            downloader_with_auth
+                .download(&audio_stream.url, &audio_path, Some(audio_pb.clone()))
+                .await?;
+            self.progress.finish("Audio", "✓ Audio downloaded");
+            Ok::<_, DownloaderError>(())
+        };
+
+        let (video_result, audio_result) = tokio::join!(video_fut, audio_fut);
+        video_result?;
+        audio_result?;
 
         // Download subtitles
+        // skip-mux 运行不会混流，字幕下载后只会随临时目录被删掉，直接跳过
         let mut subtitle_paths = Vec::new();
-        if !cli.skip_subtitle {
+        if !cli.skip_subtitle && !cli.skip_mux {
             if let Ok(subtitles) = platform
-                .get_subtitles(&video_info.aid.to_string(), &page.cid)
+                .get_subtitles(&aid, &page.cid)
                 .await
             {
-                for (i, subtitle) in subtitles.iter().enumerate() {
-                    let subtitle_path = temp_dir.join(format!("subtitle_{}.srt", i));
-                    if let Ok(()) = subtitle::download_and_convert_subtitle(
-                        &self.http_client,
-                        subtitle,
-                        &subtitle_path,
-                    )
-                    .await
-                    {
+                use futures::StreamExt;
+
+                // 各语言字幕互不依赖，并发下载并按原顺序收集
+                let mut downloads =
+                    futures::stream::iter(subtitles.iter().enumerate().map(|(i, subtitle)| {
+                        let subtitle_path = temp_dir.join(format!("subtitle_{}.srt", i));
+                        async move {
+                            let result = subtitle::download_and_convert_subtitle(
+                                &self.http_client,
+                                subtitle,
+                                &subtitle_path,
+                            )
+                            .await;
+                            (subtitle, subtitle_path, result)
+                        }
+                    }))
+                    .buffered(4);
+
+                while let Some((subtitle, subtitle_path, result)) = downloads.next().await {
+                    if result.is_ok() {
                         subtitle_paths.push(subtitle_path);
                         println!("  ✓ Subtitle downloaded: {}", subtitle.language);
                     }
@@ -499,38 +560,51 @@ impl Orchestrator {
             }
         }
 
-        // Download danmaku
-        let danmaku_temp_path = if cli.download_danmaku {
-            let danmaku_format = cli.get_danmaku_format();
-            let danmaku_ext = match danmaku_format {
-                danmaku::DanmakuFormat::Xml => "xml",
-                danmaku::DanmakuFormat::Ass => "ass",
-            };
-            let danmaku_path = temp_dir.join(format!("danmaku.{}", danmaku_ext));
-            
-            match danmaku::download_danmaku(
-                &self.http_client,
-                &page.cid,
-                &danmaku_path,
-                danmaku_format,
-            )
-            .await
-            {
-                Ok(()) => {
-                    println!("  ✓ Danmaku downloaded");
-                    Some(danmaku_path)
-                }
-                Err(e) => {
-                    tracing::warn!("Failed to download danmaku: {}", e);
-                    None
+        // Download danmaku and cover (互不依赖，并发获取)
+        let danmaku_fut = async {
+            if cli.download_danmaku {
+                let danmaku_format = cli.get_danmaku_format();
+                let danmaku_ext = match danmaku_format {
+                    danmaku::DanmakuFormat::Xml => "xml",
+                    danmaku::DanmakuFormat::Ass => "ass",
+                };
+                let danmaku_path = temp_dir.join(format!("danmaku.{}", danmaku_ext));
+
+                match danmaku::download_danmaku(
+                    &self.http_client,
+                    &page.cid,
+                    &danmaku_path,
+                    danmaku_format,
+                )
+                .await
+                {
+                    Ok(()) => {
+                        println!("  ✓ Danmaku downloaded");
+                        Some(danmaku_path)
+                    }
+                    Err(e) => {
+                        tracing::warn!("Failed to download danmaku: {}", e);
+                        None
+                    }
                 }
+            } else {
+                None
             }
-        } else {
-            None
         };
 
-        // Download cover
-        let _cover_path = if !cli.skip_cover {
+        // 返回 (封面路径, 是否复用已保存的封面)
+        let cover_fut = async {
+            if cli.skip_cover {
+                return (None, false);
+            }
+
+            // 同一视频各分P共用封面：前一分P已保存过就直接复用本地文件
+            if let Some((cached_id, cached_path)) = self.saved_cover.lock().await.as_ref() {
+                if cached_id == &video_info.id && cached_path.is_file() {
+                    return (Some(cached_path.clone()), true);
+                }
+            }
+
             let cover_url = platform.get_cover(video_info);
             let cover_path = temp_dir.join("cover.jpg");
             if self
@@ -540,14 +614,15 @@ impl Orchestrator {
                 .is_ok()
             {
                 println!("  ✓ Cover downloaded");
-                Some(cover_path)
+                (Some(cover_path), false)
             } else {
-                None
+                (None, false)
             }
-        } else {
-            None
         };
 
+        let (danmaku_temp_path, (cover_temp_path, cover_from_cache)) =
+            tokio::join!(danmaku_fut, cover_fut);
+
         // Determine output path
         let output_path = if let Some(ref output) = cli.output {
             let parsed = file::parse_template(
@@ -560,7 +635,8 @@ impl Orchestrator {
             let path = PathBuf::from(&parsed);
             
             // If the path is a directory or doesn't have an extension, add a filename
-            if path.is_dir() || path.extension().is_none() {
+            // （先做纯字符串的扩展名判断，能短路时省掉is_dir的一次stat）
+            if path.extension().is_none() || path.is_dir() {
                 let filename = if video_info.pages.len() > 1 {
                     format!("P{:02}_{}.mp4", page.number, file::sanitize_filename(&page.title))
                 } else {
@@ -584,8 +660,8 @@ impl Orchestrator {
             // Just copy the files
             let video_out = output_path.with_extension("video.m4s");
             let audio_out = output_path.with_extension("audio.m4s");
-            tokio::fs::copy(&video_path, &video_out).await?;
-            tokio::fs::copy(&audio_path, &audio_out).await?;
+            file::move_or_copy(&video_path, &video_out).await?;
+            file::move_or_copy(&audio_path, &audio_out).await?;
             println!("  ✓ Files saved (muxing skipped)");
         } else {
             // 检测是否是杜比视界 (quality_id 126)
@@ -612,11 +688,32 @@ impl Orchestrator {
                     .unwrap_or("xml");
                 let danmaku_output_path = output_path.with_extension(danmaku_ext);
                 
-                tokio::fs::copy(&danmaku_temp_path, &danmaku_output_path).await?;
+                file::move_or_copy(&danmaku_temp_path, &danmaku_output_path).await?;
                 println!("  ✓ Danmaku saved to: {}", danmaku_output_path.display());
             }
         }
 
+        // Save cover next to the output（此前下载后留在临时目录，随清理一起被删掉）
+        if let Some(cover_temp_path) = cover_temp_path {
+            let cover_output_path = output_path.with_extension("jpg");
+            // 复用缓存时源文件是前一分P的输出，必须copy保留；新下载的直接move
+            let saved = if cover_from_cache {
+                tokio::fs::copy(&cover_temp_path, &cover_output_path)
+                    .await
+                    .is_ok()
+            } else {
+                file::move_or_copy(&cover_temp_path, &cover_output_path)
+                    .await
+                    .is_ok()
+            };
+
+            if saved {
+                println!("  ✓ Cover saved to: {}", cover_output_path.display());
+                *self.saved_cover.lock().await =
+                    Some((video_info.id.clone(), cover_output_path));
+            }
+        }
+
         // Cleanup temp directory
         file::cleanup_temp_dir(&temp_dir).await?;
 
@@ -73,11 +73,11 @@ impl LoginManager {
             .poll_with_retry(&qr_data.key, 180)
             .await?;
 
-        // 步骤5: 清理资源
-        if qrcode_path.exists() {
-            if let Err(e) = std::fs::remove_file(qrcode_path) {
-                tracing::warn!("无法删除二维码图片: {}", e);
-            }
+        // 步骤5: 清理资源（直接删除并容忍文件不存在，省掉先行exists()的stat）
+        match std::fs::remove_file(qrcode_path) {
+            Ok(()) => {}
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => {}
+            Err(e) => tracing::warn!("无法删除二维码图片: {}", e),
         }
 
         Ok(credentials)
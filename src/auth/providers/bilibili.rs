@@ -5,12 +5,114 @@ use crate::platform::bilibili::ApiMode;
 use crate::utils::http::HttpClient;
 use async_trait::async_trait;
 use reqwest::Response;
-use serde_json::Value;
+use serde::Deserialize;
 use std::collections::HashMap;
 use std::sync::Arc;
 
 use super::AppSignManager;
 
+/// Web端申请二维码的响应结构
+#[derive(Debug, Deserialize)]
+struct WebQrcodeResponse {
+    code: i64,
+    message: Option<String>,
+    data: Option<WebQrcodeData>,
+}
+
+#[derive(Debug, Deserialize)]
+struct WebQrcodeData {
+    url: String,
+    qrcode_key: String,
+}
+
+/// Web端轮询登录的响应结构（状态码在data.code里）
+#[derive(Debug, Deserialize)]
+struct WebPollResponse {
+    data: Option<WebPollData>,
+}
+
+#[derive(Debug, Deserialize)]
+struct WebPollData {
+    code: i64,
+    message: Option<String>,
+}
+
+/// TV端申请二维码的响应结构
+#[derive(Debug, Deserialize)]
+struct TvQrcodeResponse {
+    code: i64,
+    message: Option<String>,
+    data: Option<TvQrcodeData>,
+}
+
+#[derive(Debug, Deserialize)]
+struct TvQrcodeData {
+    url: String,
+    auth_code: String,
+}
+
+/// TV端轮询登录的响应结构
+/// data只在登录成功时才是凭证结构，轮询中为空或其他形状，延迟解析
+#[derive(Debug, Deserialize)]
+struct TvPollResponse {
+    code: i64,
+    message: Option<String>,
+    data: Option<serde_json::Value>,
+}
+
+/// TV端登录成功后data字段的凭证结构
+#[derive(Debug, Deserialize)]
+struct TvLoginData {
+    access_token: String,
+    refresh_token: String,
+    mid: Option<u64>,
+    expires_in: Option<u64>,
+    cookie_info: Option<TvCookieInfo>,
+}
+
+#[derive(Debug, Deserialize)]
+struct TvCookieInfo {
+    cookies: Vec<TvCookie>,
+}
+
+#[derive(Debug, Deserialize)]
+struct TvCookie {
+    name: String,
+    value: String,
+}
+
+/// 登录凭证需要的Cookie及其固定拼接顺序（Web与TV端共用）
+const REQUIRED_COOKIES: [&str; 5] = [
+    "SESSDATA",
+    "bili_jct",
+    "DedeUserID",
+    "DedeUserID__ckMd5",
+    "sid",
+];
+
+/// 按固定顺序把Cookie表拼接为 name1=value1; name2=value2 形式
+fn join_required_cookies(cookie_map: &HashMap<String, String>) -> String {
+    let mut cookie_parts = Vec::new();
+
+    for cookie_name in &REQUIRED_COOKIES {
+        if let Some(cookie_value) = cookie_map.get(*cookie_name) {
+            cookie_parts.push(format!("{}={}", cookie_name, cookie_value));
+        }
+    }
+
+    cookie_parts.join("; ")
+}
+
+/// TV端表单请求的固定请求头（申请二维码和每秒轮询共用，不重复解析）
+fn form_headers() -> reqwest::header::HeaderMap {
+    let mut headers = reqwest::header::HeaderMap::new();
+    headers.insert(
+        "Content-Type",
+        reqwest::header::HeaderValue::from_static("application/x-www-form-urlencoded"),
+    );
+    headers
+}
+
 /// 哔哩哔哩认证提供者
 pub struct BilibiliAuthProvider {
     client: Arc<HttpClient>,
@@ -47,45 +149,32 @@ impl BilibiliAuthProvider {
         let url = "https://passport.bilibili.com/x/passport-login/web/qrcode/generate";
         let response = self.client.get(url, None).await?;
 
-        let json: Value = response.json().await.map_err(|e| {
+        // 直接反序列化为类型化结构，一次解析完成字段校验
+        let body = response.bytes().await?;
+        let json: WebQrcodeResponse = serde_json::from_slice(&body).map_err(|e| {
             AuthError::InvalidResponse(format!("Failed to parse JSON response: {}", e))
         })?;
 
         // 检查响应码
-        let code = json["code"]
-            .as_i64()
-            .ok_or_else(|| AuthError::InvalidResponse("Missing 'code' field".to_string()))?;
-
-        if code != 0 {
-            let message = json["message"]
-                .as_str()
-                .unwrap_or("Unknown error")
-                .to_string();
+        if json.code != 0 {
+            let message = json.message.as_deref().unwrap_or("Unknown error");
             return Err(AuthError::InvalidResponse(format!(
                 "API returned error code {}: {}",
-                code, message
+                json.code, message
             ))
             .into());
         }
 
         // 提取二维码数据
-        let url = json["data"]["url"]
-            .as_str()
-            .ok_or_else(|| AuthError::InvalidResponse("Missing 'data.url' field".to_string()))?
-            .to_string();
-
-        let qrcode_key = json["data"]["qrcode_key"]
-            .as_str()
-            .ok_or_else(|| {
-                AuthError::InvalidResponse("Missing 'data.qrcode_key' field".to_string())
-            })?
-            .to_string();
+        let data = json
+            .data
+            .ok_or_else(|| AuthError::InvalidResponse("Missing 'data' field".to_string()))?;
 
         tracing::debug!("Web QR code generated successfully");
 
         Ok(QRCodeData {
-            url,
-            key: qrcode_key,
+            url: data.url,
+            key: data.qrcode_key,
         })
     }
 
@@ -104,17 +193,18 @@ impl BilibiliAuthProvider {
         // 先提取Cookie（在消费response body之前）
         let cookies = self.extract_cookies_from_response(&response)?;
 
-        // 然后解析JSON
-        let json: Value = response.json().await.map_err(|e| {
+        // 然后解析JSON（类型化结构，不走动态Value）
+        let body = response.bytes().await?;
+        let json: WebPollResponse = serde_json::from_slice(&body).map_err(|e| {
             AuthError::InvalidResponse(format!("Failed to parse JSON response: {}", e))
         })?;
 
         // 检查data.code字段（数字类型）
-        let data_code = json["data"]["code"]
-            .as_i64()
+        let data = json
+            .data
             .ok_or_else(|| AuthError::InvalidResponse("Missing 'data.code' field".to_string()))?;
 
-        match data_code {
+        match data.code {
             0 => {
                 // 登录成功
                 tracing::debug!("Web login successful");
@@ -148,13 +238,10 @@ impl BilibiliAuthProvider {
                 Ok(LoginStatus::Expired)
             }
             _ => {
-                let message = json["data"]["message"]
-                    .as_str()
-                    .unwrap_or("Unknown error")
-                    .to_string();
+                let message = data.message.as_deref().unwrap_or("Unknown error");
                 Ok(LoginStatus::Failed(format!(
                     "Unexpected code {}: {}",
-                    data_code, message
+                    data.code, message
                 )))
             }
         }
@@ -186,23 +273,10 @@ impl BilibiliAuthProvider {
             }
         }
 
-        // 按固定顺序提取需要的Cookie
-        let required_cookies = ["SESSDATA", "bili_jct", "DedeUserID", "DedeUserID__ckMd5", "sid"];
-        let mut cookie_parts = Vec::new();
-
-        for cookie_name in &required_cookies {
-            if let Some(cookie_value) = cookie_map.get(*cookie_name) {
-                cookie_parts.push(format!("{}={}", cookie_name, cookie_value));
-            }
-        }
-
-        // 拼接为字符串，格式：name1=value1; name2=value2
-        let cookies = cookie_parts.join("; ");
+        // 按固定顺序提取需要的Cookie并拼接为字符串
+        let cookies = join_required_cookies(&cookie_map);
 
-        tracing::debug!(
-            "Extracted {} cookies from response",
-            cookie_parts.len()
-        );
+        tracing::debug!("Extracted cookies from response: {}", !cookies.is_empty());
 
         Ok(cookies)
     }
@@ -237,56 +311,33 @@ impl BilibiliAuthProvider {
 
         let url = "https://passport.snm0516.aisee.tv/x/passport-tv-login/qrcode/auth_code";
 
-        // 设置请求头
-        let mut headers = reqwest::header::HeaderMap::new();
-        headers.insert(
-            "Content-Type",
-            "application/x-www-form-urlencoded"
-                .parse()
-                .map_err(|e| AuthError::Network(format!("Invalid header: {}", e)))?,
-        );
-
-        let response = self.client.post(url, &body, Some(headers)).await?;
+        let response = self.client.post(url, &body, Some(form_headers())).await?;
 
-        let json: Value = response.json().await.map_err(|e| {
+        let resp_body = response.bytes().await?;
+        let json: TvQrcodeResponse = serde_json::from_slice(&resp_body).map_err(|e| {
             AuthError::InvalidResponse(format!("Failed to parse JSON response: {}", e))
         })?;
 
         // 检查响应码
-        let code = json["code"]
-            .as_i64()
-            .ok_or_else(|| AuthError::InvalidResponse("Missing 'code' field".to_string()))?;
-
-        if code != 0 {
-            let message = json["message"]
-                .as_str()
-                .unwrap_or("Unknown error")
-                .to_string();
+        if json.code != 0 {
+            let message = json.message.as_deref().unwrap_or("Unknown error");
             return Err(AuthError::InvalidResponse(format!(
                 "API returned error code {}: {}",
-                code, message
+                json.code, message
             ))
             .into());
         }
 
         // 提取二维码数据
-        let url = json["data"]["url"]
-            .as_str()
-            .ok_or_else(|| AuthError::InvalidResponse("Missing 'data.url' field".to_string()))?
-            .to_string();
-
-        let auth_code = json["data"]["auth_code"]
-            .as_str()
-            .ok_or_else(|| {
-                AuthError::InvalidResponse("Missing 'data.auth_code' field".to_string())
-            })?
-            .to_string();
+        let data = json
+            .data
+            .ok_or_else(|| AuthError::InvalidResponse("Missing 'data' field".to_string()))?;
 
         tracing::debug!("TV QR code generated successfully");
 
         Ok(QRCodeData {
-            url,
-            key: auth_code,
+            url: data.url,
+            key: data.auth_code,
         })
     }
 
@@ -320,31 +371,32 @@ impl BilibiliAuthProvider {
 
         let url = "https://passport.bilibili.com/x/passport-tv-login/qrcode/poll";
 
-        // 设置请求头
-        let mut headers = reqwest::header::HeaderMap::new();
-        headers.insert(
-            "Content-Type",
-            "application/x-www-form-urlencoded"
-                .parse()
-                .map_err(|e| AuthError::Network(format!("Invalid header: {}", e)))?,
-        );
-
-        let response = self.client.post(url, &body, Some(headers)).await?;
+        let response = self.client.post(url, &body, Some(form_headers())).await?;
 
-        let json: Value = response.json().await.map_err(|e| {
+        let resp_body = response.bytes().await?;
+        let json: TvPollResponse = serde_json::from_slice(&resp_body).map_err(|e| {
             AuthError::InvalidResponse(format!("Failed to parse JSON response: {}", e))
         })?;
 
         // 检查根级别的code字段（数字类型）
-        let code = json["code"]
-            .as_i64()
-            .ok_or_else(|| AuthError::InvalidResponse("Missing 'code' field".to_string()))?;
-
-        match code {
+        match json.code {
             0 => {
-                // 登录成功
+                // 登录成功，此时才把data解析为凭证结构
                 tracing::debug!("TV login successful");
-                let credentials = self.extract_tv_credentials(&json)?;
+                let data: TvLoginData = json
+                    .data
+                    .map(serde_json::from_value)
+                    .transpose()
+                    .map_err(|e| {
+                        AuthError::InvalidResponse(format!(
+                            "Failed to parse login credentials: {}",
+                            e
+                        ))
+                    })?
+                    .ok_or_else(|| {
+                        AuthError::InvalidResponse("Missing 'data' field".to_string())
+                    })?;
+                let credentials = self.extract_tv_credentials(data)?;
                 Ok(LoginStatus::Success(credentials))
             }
             86039 => {
@@ -360,13 +412,10 @@ impl BilibiliAuthProvider {
                 Ok(LoginStatus::Expired)
             }
             _ => {
-                let message = json["message"]
-                    .as_str()
-                    .unwrap_or("Unknown error")
-                    .to_string();
+                let message = json.message.as_deref().unwrap_or("Unknown error");
                 Ok(LoginStatus::Failed(format!(
                     "Unexpected code {}: {}",
-                    code, message
+                    json.code, message
                 )))
             }
         }
@@ -375,28 +424,9 @@ impl BilibiliAuthProvider {
     /// 从TV端响应中提取Cookie和Token
     ///
     /// TV端返回结构：data.cookie_info.cookies数组 + data.access_token + data.refresh_token
-    fn extract_tv_credentials(&self, json: &Value) -> Result<Credentials> {
-        // 提取access_token
-        let access_token = json["data"]["access_token"]
-            .as_str()
-            .ok_or_else(|| {
-                AuthError::InvalidResponse("Missing 'data.access_token' field".to_string())
-            })?
-            .to_string();
-
-        // 提取refresh_token
-        let refresh_token = json["data"]["refresh_token"]
-            .as_str()
-            .ok_or_else(|| {
-                AuthError::InvalidResponse("Missing 'data.refresh_token' field".to_string())
-            })?
-            .to_string();
-
-        // 提取mid（用户ID）
-        let mid = json["data"]["mid"].as_u64();
-
-        // 提取expires_in并计算expires_at
-        let expires_at = json["data"]["expires_in"].as_u64().map(|expires_in| {
+    fn extract_tv_credentials(&self, data: TvLoginData) -> Result<Credentials> {
+        // 计算expires_at
+        let expires_at = data.expires_in.map(|expires_in| {
             std::time::SystemTime::now()
                 .duration_since(std::time::UNIX_EPOCH)
                 .unwrap()
@@ -405,50 +435,31 @@ impl BilibiliAuthProvider {
         });
 
         // 提取Cookie
-        let cookies_array = json["data"]["cookie_info"]["cookies"]
-            .as_array()
-            .ok_or_else(|| {
-                AuthError::InvalidResponse("Missing 'data.cookie_info.cookies' field".to_string())
-            })?;
-
-        let mut cookie_map: HashMap<String, String> = HashMap::new();
-        for cookie_obj in cookies_array {
-            if let (Some(name), Some(value)) = (
-                cookie_obj["name"].as_str(),
-                cookie_obj["value"].as_str(),
-            ) {
-                cookie_map.insert(name.to_string(), value.to_string());
-            }
-        }
-
-        // 按固定顺序提取需要的Cookie
-        let required_cookies = ["SESSDATA", "bili_jct", "DedeUserID", "DedeUserID__ckMd5", "sid"];
-        let mut cookie_parts = Vec::new();
+        let cookie_info = data.cookie_info.ok_or_else(|| {
+            AuthError::InvalidResponse("Missing 'data.cookie_info.cookies' field".to_string())
+        })?;
 
-        for cookie_name in &required_cookies {
-            if let Some(cookie_value) = cookie_map.get(*cookie_name) {
-                cookie_parts.push(format!("{}={}", cookie_name, cookie_value));
-            }
-        }
+        let cookie_map: HashMap<String, String> = cookie_info
+            .cookies
+            .into_iter()
+            .map(|cookie| (cookie.name, cookie.value))
+            .collect();
 
-        // 拼接为字符串
-        let cookies = if cookie_parts.is_empty() {
-            None
-        } else {
-            Some(cookie_parts.join("; "))
-        };
+        // 按固定顺序提取需要的Cookie并拼接为字符串
+        let joined = join_required_cookies(&cookie_map);
+        let cookies = if joined.is_empty() { None } else { Some(joined) };
 
         tracing::debug!(
-            "Extracted TV credentials: {} cookies, access_token present",
-            cookie_parts.len()
+            "Extracted TV credentials: cookies present: {}, access_token present",
+            cookies.is_some()
         );
 
         Ok(Credentials {
             cookie: cookies,
-            access_token: Some(access_token),
-            refresh_token: Some(refresh_token),
+            access_token: Some(data.access_token),
+            refresh_token: Some(data.refresh_token),
             expires_at,
-            mid,
+            mid: data.mid,
         })
     }
 }
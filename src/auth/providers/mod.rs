@@ -42,19 +42,24 @@ impl AppSignManager {
         let sorted_params: std::collections::BTreeMap<&String, &String> =
             params.iter().collect();
 
-        // 2. 拼接为query string
-        let query_string = sorted_params
-            .iter()
-            .map(|(k, v)| format!("{}={}", k, v))
-            .collect::<Vec<_>>()
-            .join("&");
-
-        // 3. 在末尾直接追加appsec（不加&）
-        let sign_string = format!("{}{}", query_string, self.appsec);
-
-        // 4. 计算MD5（小写十六进制）
-        let digest = md5::compute(sign_string.as_bytes());
-        format!("{:x}", digest)
+        // 2-4. 边拼接边喂给MD5，不构造中间的query string
+        let mut context = md5::Context::new();
+        let mut first = true;
+
+        for (k, v) in &sorted_params {
+            if !first {
+                context.consume(b"&");
+            }
+            first = false;
+            context.consume(k.as_bytes());
+            context.consume(b"=");
+            context.consume(v.as_bytes());
+        }
+
+        // 末尾直接追加appsec（不加&）
+        context.consume(self.appsec.as_bytes());
+
+        format!("{:x}", context.compute())
     }
 
     /// 获取当前Unix时间戳（秒）
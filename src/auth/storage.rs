@@ -91,46 +91,68 @@ impl CredentialStorage {
     /// # Returns
     ///
     /// 返回凭证对象，如果不存在返回None
+    #[allow(dead_code)]
     pub fn load_from_config(config_path: &Path) -> Result<Option<Credentials>> {
         // 首先尝试从auth.toml加载
+        if let Some(credentials) = Self::load_auth_file(config_path)? {
+            return Ok(Some(credentials));
+        }
+
+        // 如果auth.toml不存在，尝试从config.toml的[auth]部分加载（向后兼容）
+        match std::fs::read_to_string(config_path) {
+            Ok(content) => {
+                tracing::debug!(
+                    "auth.toml not found, trying to load from config.toml: {}",
+                    config_path.display()
+                );
+                let config: crate::utils::config::Config = toml::from_str(&content).map_err(|e| {
+                    AuthError::InvalidResponse(format!("Failed to parse config file: {}", e))
+                })?;
+
+                if let Some(auth_config) = config.auth {
+                    return Ok(Some(Self::auth_config_to_credentials(&auth_config)));
+                }
+            }
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => {}
+            Err(e) => {
+                return Err(AuthError::InvalidResponse(format!(
+                    "Failed to read config file: {}",
+                    e
+                ))
+                .into());
+            }
+        }
+
+        Ok(None)
+    }
+
+    /// 只从auth.toml加载凭证，不回退到config.toml
+    ///
+    /// 调用方若已在内存中持有解析好的Config（如Orchestrator），
+    /// 用这个入口可避免把config.toml再读取解析一遍
+    pub fn load_auth_file(config_path: &Path) -> Result<Option<Credentials>> {
         let auth_path = config_path
             .parent()
             .unwrap_or_else(|| Path::new("."))
             .join("auth.toml");
 
-        if auth_path.exists() {
-            tracing::debug!("Loading credentials from: {}", auth_path.display());
-            let content = std::fs::read_to_string(&auth_path).map_err(|e| {
-                AuthError::InvalidResponse(format!("Failed to read auth file: {}", e))
-            })?;
-
-            let auth_config: AuthConfig = toml::from_str(&content).map_err(|e| {
-                AuthError::InvalidResponse(format!("Failed to parse auth file: {}", e))
-            })?;
-
-            return Ok(Some(Self::auth_config_to_credentials(&auth_config)));
-        }
+        // 直接读取并按 NotFound 回退，省掉 exists() 的额外 stat
+        match std::fs::read_to_string(&auth_path) {
+            Ok(content) => {
+                tracing::debug!("Loading credentials from: {}", auth_path.display());
+                let auth_config: AuthConfig = toml::from_str(&content).map_err(|e| {
+                    AuthError::InvalidResponse(format!("Failed to parse auth file: {}", e))
+                })?;
 
-        // 如果auth.toml不存在，尝试从config.toml的[auth]部分加载（向后兼容）
-        if config_path.exists() {
-            tracing::debug!(
-                "auth.toml not found, trying to load from config.toml: {}",
-                config_path.display()
-            );
-            let content = std::fs::read_to_string(config_path).map_err(|e| {
-                AuthError::InvalidResponse(format!("Failed to read config file: {}", e))
-            })?;
-
-            let config: crate::utils::config::Config = toml::from_str(&content).map_err(|e| {
-                AuthError::InvalidResponse(format!("Failed to parse config file: {}", e))
-            })?;
-
-            if let Some(auth_config) = config.auth {
-                return Ok(Some(Self::auth_config_to_credentials(&auth_config)));
+                Ok(Some(Self::auth_config_to_credentials(&auth_config)))
             }
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => Ok(None),
+            Err(e) => Err(AuthError::InvalidResponse(format!(
+                "Failed to read auth file: {}",
+                e
+            ))
+            .into()),
         }
-
-        Ok(None)
     }
 
     /// 设置配置文件权限（仅Unix）
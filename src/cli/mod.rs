@@ -4,7 +4,7 @@ use std::path::PathBuf;
 #[derive(Parser, Debug)]
 #[command(name = "rvd")]
 #[command(author = "RVD Contributors")]
-#[command(version = "0.2.7")]
+#[command(version = env!("CARGO_PKG_VERSION"))]
 #[command(about = "A modular video downloader written in Rust", long_about = None)]
 pub struct Cli {
     /// Video URL to download (supports bilibili BV/av/ep/ss)
@@ -36,9 +36,9 @@ pub struct Cli {
     #[arg(short = 'p', long)]
     pub pages: Option<String>,
 
-    /// Number of download threads
-    #[arg(short = 't', long, default_value = "4")]
-    pub threads: usize,
+    /// Number of download threads (defaults to config thread_count, then CPU parallelism)
+    #[arg(short = 't', long)]
+    pub threads: Option<usize>,
 
     /// Skip subtitle download
     #[arg(long)]
@@ -122,21 +122,28 @@ impl Cli {
         if let Some(ref q) = self.quality {
             q.split(',').map(|s| s.trim().to_string()).collect()
         } else {
-            vec!["1080P".to_string(), "720P".to_string(), "480P".to_string()]
+            crate::types::DEFAULT_QUALITY_PRIORITY
+                .iter()
+                .map(|s| s.to_string())
+                .collect()
         }
     }
 
     pub fn parse_codec_priority(&self) -> Vec<String> {
+        // 构建时就折叠成小写，选流时不再逐次转换
         if let Some(ref c) = self.codec {
-            c.split(',').map(|s| s.trim().to_string()).collect()
+            c.split(',').map(|s| s.trim().to_lowercase()).collect()
         } else {
-            vec!["avc".to_string(), "hevc".to_string(), "av1".to_string()]
+            crate::types::DEFAULT_CODEC_PRIORITY
+                .iter()
+                .map(|s| s.to_string())
+                .collect()
         }
     }
 
     pub fn parse_pages(&self) -> Option<Vec<usize>> {
         if let Some(ref pages_str) = self.pages {
-            if pages_str.to_uppercase() == "ALL" {
+            if pages_str.eq_ignore_ascii_case("ALL") {
                 return None; // None means all pages
             }
 
@@ -175,6 +182,15 @@ impl Cli {
         }
     }
 
+    /// Resolve the download thread count: CLI > 配置文件 > CPU并行度
+    pub fn effective_threads(&self, config: &crate::utils::config::Config) -> usize {
+        self.threads.or(config.thread_count).unwrap_or_else(|| {
+            std::thread::available_parallelism()
+                .map(|n| n.get())
+                .unwrap_or(4)
+        })
+    }
+
     pub fn get_api_mode(&self) -> crate::platform::bilibili::ApiMode {
         use crate::platform::bilibili::ApiMode;
         
@@ -192,10 +208,10 @@ impl Cli {
     pub fn get_danmaku_format(&self) -> crate::core::danmaku::DanmakuFormat {
         use crate::core::danmaku::DanmakuFormat;
         
-        match self.danmaku_format.to_lowercase().as_str() {
-            "xml" => DanmakuFormat::Xml,
-            "ass" => DanmakuFormat::Ass,
-            _ => DanmakuFormat::Ass,
+        if self.danmaku_format.eq_ignore_ascii_case("xml") {
+            DanmakuFormat::Xml
+        } else {
+            DanmakuFormat::Ass
         }
     }
 
@@ -21,18 +21,7 @@ pub async fn download_danmaku(
     let api = format!("https://comment.bilibili.com/{}.xml", cid);
     tracing::debug!("Fetching danmaku from: {}", api);
     
-    // Create a client with automatic decompression disabled
-    // We need to manually decompress because Bilibili's deflate encoding causes issues with reqwest
-    let raw_client = reqwest::Client::builder()
-        .user_agent("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
-        .timeout(std::time::Duration::from_secs(60))
-        .no_gzip()
-        .no_deflate()
-        .no_brotli()
-        .build()
-        .map_err(crate::error::DownloaderError::Network)?;
-    
-    let response = raw_client.get(&api).send().await?;
+    let response = raw_danmaku_client().get(&api).send().await?;
     
     if !response.status().is_success() {
         return Err(crate::error::DownloaderError::DownloadFailed(
@@ -45,8 +34,9 @@ pub async fn download_danmaku(
     let bytes = response.bytes().await?;
     
     // Try to decode as UTF-8 directly first, or decompress if needed
-    let xml_content = match String::from_utf8(bytes.to_vec()) {
-        Ok(text) => text,
+    // （原地校验UTF-8，不复制响应体）
+    let xml_content: std::borrow::Cow<str> = match std::str::from_utf8(&bytes) {
+        Ok(text) => text.into(),
         Err(_) => {
             // Try deflate decompression (most common for Bilibili danmaku API)
             use flate2::read::DeflateDecoder;
@@ -57,7 +47,7 @@ pub async fn download_danmaku(
             match decoder.read_to_string(&mut decompressed) {
                 Ok(_) => {
                     tracing::debug!("Decompressed danmaku with deflate");
-                    decompressed
+                    decompressed.into()
                 }
                 Err(_) => {
                     // Try gzip as fallback
@@ -69,7 +59,7 @@ pub async fn download_danmaku(
                             format!("Failed to decompress danmaku: {}", e)
                         ))?;
                     tracing::debug!("Decompressed danmaku with gzip");
-                    decompressed
+                    decompressed.into()
                 }
             }
         }
@@ -98,6 +88,25 @@ pub async fn download_danmaku(
     Ok(())
 }
 
+/// 禁用自动解压的弹幕专用客户端（只构建一次，多P下载共享连接池）
+///
+/// B站弹幕接口的deflate编码会让reqwest自动解压出错，需要拿到原始字节手动解压
+fn raw_danmaku_client() -> &'static reqwest::Client {
+    use std::sync::OnceLock;
+
+    static RAW_CLIENT: OnceLock<reqwest::Client> = OnceLock::new();
+    RAW_CLIENT.get_or_init(|| {
+        reqwest::Client::builder()
+            .user_agent("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+            .timeout(std::time::Duration::from_secs(60))
+            .no_gzip()
+            .no_deflate()
+            .no_brotli()
+            .build()
+            .expect("Failed to create danmaku HTTP client")
+    })
+}
+
 /// 格式化 XML 弹幕
 fn format_xml(xml: &str) -> Result<String> {
     use quick_xml::events::Event;
@@ -108,7 +117,8 @@ fn format_xml(xml: &str) -> Result<String> {
     let mut reader = Reader::from_str(xml);
     reader.trim_text(true);
 
-    let mut writer = Writer::new_with_indent(Cursor::new(Vec::new()), b' ', 2);
+    // 输出大小与输入同量级（加上缩进），按输入长度预分配避免反复扩容
+    let mut writer = Writer::new_with_indent(Cursor::new(Vec::with_capacity(xml.len())), b' ', 2);
     
     loop {
         match reader.read_event() {
@@ -133,16 +143,43 @@ fn format_xml(xml: &str) -> Result<String> {
     })
 }
 
-/// 解析 XML 弹幕
-fn parse_danmaku_xml(xml: &str) -> Result<Vec<DanmakuItem>> {
-    let mut items = Vec::new();
+/// 弹幕条目的正则（只编译一次）
+fn danmaku_regex() -> &'static regex::Regex {
+    use std::sync::OnceLock;
+
+    static DANMAKU_REGEX: OnceLock<regex::Regex> = OnceLock::new();
+    DANMAKU_REGEX.get_or_init(|| regex::Regex::new(r#"<d p="([^"]+)">([^<]+)</d>"#).unwrap())
+}
+
+/// ASS 文件头（Script Info、样式定义和事件表头都是固定内容）
+const ASS_HEADER: &str = "\
+[Script Info]
+Title: Bilibili Danmaku
+ScriptType: v4.00+
+Collisions: Normal
+PlayResX: 1920
+PlayResY: 1080
 
-    // 简单的 XML 解析（使用正则表达式）
-    let re = regex::Regex::new(r#"<d p="([^"]+)">([^<]+)</d>"#).unwrap();
+[V4+ Styles]
+Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
+Style: Default,Arial,36,&H00FFFFFF,&H00FFFFFF,&H00000000,&H00000000,0,0,0,0,100,100,0,0,1,2,0,2,20,20,20,0
 
-    for cap in re.captures_iter(xml) {
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+";
+
+/// 转换 XML 弹幕为 ASS 格式
+fn convert_xml_to_ass(xml: &str) -> Result<String> {
+    use std::fmt::Write;
+
+    // 预估容量：文件头 + Dialogue行与XML条目长度同量级
+    let mut ass = String::with_capacity(ASS_HEADER.len() + xml.len());
+    ass.push_str(ASS_HEADER);
+
+    // 单次遍历：解析出的每条弹幕直接写成 Dialogue 行，不经过中间 Vec
+    for cap in danmaku_regex().captures_iter(xml) {
         let params = &cap[1];
-        let text = &cap[2];
+        let raw_text = &cap[2];
 
         let parts: Vec<&str> = params.split(',').collect();
         if parts.len() < 8 {
@@ -151,65 +188,27 @@ fn parse_danmaku_xml(xml: &str) -> Result<Vec<DanmakuItem>> {
 
         let time = parts[0].parse::<f64>().unwrap_or(0.0);
         let mode = parts[1].parse::<u32>().unwrap_or(1);
-        let font_size = parts[2].parse::<u32>().unwrap_or(25);
         let color = parts[3].parse::<u32>().unwrap_or(0xFFFFFF);
 
-        items.push(DanmakuItem {
-            time,
-            mode,
-            font_size,
-            color,
-            text: text.to_string(),
-        });
-    }
-
-    Ok(items)
-}
-
-/// 转换 XML 弹幕为 ASS 格式
-fn convert_xml_to_ass(xml: &str) -> Result<String> {
-    let items = parse_danmaku_xml(xml)?;
-
-    let mut ass = String::new();
-
-    // ASS 文件头
-    ass.push_str("[Script Info]\n");
-    ass.push_str("Title: Bilibili Danmaku\n");
-    ass.push_str("ScriptType: v4.00+\n");
-    ass.push_str("Collisions: Normal\n");
-    ass.push_str("PlayResX: 1920\n");
-    ass.push_str("PlayResY: 1080\n");
-    ass.push('\n');
+        let start_time = format_ass_time(time);
+        let end_time = format_ass_time(time + 5.0); // 弹幕显示5秒
 
-    // 样式定义
-    ass.push_str("[V4+ Styles]\n");
-    ass.push_str("Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding\n");
-    ass.push_str("Style: Default,Arial,36,&H00FFFFFF,&H00FFFFFF,&H00000000,&H00000000,0,0,0,0,100,100,0,0,1,2,0,2,20,20,20,0\n");
-    ass.push('\n');
-
-    // 事件
-    ass.push_str("[Events]\n");
-    ass.push_str("Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n");
-
-    for item in items {
-        let start_time = format_ass_time(item.time);
-        let end_time = format_ass_time(item.time + 5.0); // 弹幕显示5秒
-
-        let color = format!("&H{:06X}&", item.color);
-        let text = item.text.replace('\n', "\\N");
+        let color = format!("&H{:06X}&", color);
+        let text = raw_text.replace('\n', "\\N");
 
         // 根据弹幕模式设置位置
-        let position = match item.mode {
+        let position = match mode {
             1 => "\\move(1920,540,0,540)", // 滚动弹幕
             4 => "\\pos(960,100)",          // 底部弹幕
             5 => "\\pos(960,980)",          // 顶部弹幕
             _ => "\\move(1920,540,0,540)",
         };
 
-        ass.push_str(&format!(
-            "Dialogue: 0,{},{},Default,,0,0,0,,{{{}\\c{}}}{}\\N\n",
+        let _ = writeln!(
+            ass,
+            "Dialogue: 0,{},{},Default,,0,0,0,,{{{}\\c{}}}{}\\N",
             start_time, end_time, position, color, text
-        ));
+        );
     }
 
     Ok(ass)
@@ -217,21 +216,13 @@ fn convert_xml_to_ass(xml: &str) -> Result<String> {
 
 /// 格式化时间为 ASS 格式 (H:MM:SS.CC)
 fn format_ass_time(seconds: f64) -> String {
-    let hours = (seconds / 3600.0) as u32;
-    let minutes = ((seconds % 3600.0) / 60.0) as u32;
-    let secs = (seconds % 60.0) as u32;
-    let centisecs = ((seconds % 1.0) * 100.0) as u32;
+    // 一次换算成厘秒后全部用整数运算，省掉逐字段的浮点取模
+    let total_centis = (seconds * 100.0) as u64;
+    let centisecs = total_centis % 100;
+    let total_secs = total_centis / 100;
+    let hours = total_secs / 3600;
+    let minutes = (total_secs % 3600) / 60;
+    let secs = total_secs % 60;
 
     format!("{}:{:02}:{:02}.{:02}", hours, minutes, secs, centisecs)
 }
-
-/// 弹幕项
-#[derive(Debug, Clone)]
-struct DanmakuItem {
-    time: f64,
-    mode: u32,
-    #[allow(dead_code)] // 保留用于未来扩展
-    font_size: u32,
-    color: u32,
-    text: String,
-}
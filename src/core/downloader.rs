@@ -9,6 +9,23 @@ use tokio::fs::File;
 use tokio::io::AsyncWriteExt;
 use tokio::process::Command;
 
+/// 分块下载的块大小（所有Downloader实例共享）
+const CHUNK_SIZE: usize = 10 * 1024 * 1024; // 10MB chunks
+
+/// aria2c每次调用都相同的基础参数（连接数对齐BBDown默认值）
+const ARIA2C_BASE_ARGS: [&str; 8] = [
+    // Basic options
+    "--auto-file-renaming=false",
+    "--download-result=hide",
+    "--allow-overwrite=true",
+    "--console-log-level=warn",
+    // Connection options
+    "-x16", // max connections per server
+    "-s16", // split into 16 parts
+    "-j16", // max concurrent downloads
+    "-k5M", // min split size 5MB
+];
+
 /// Download method to use
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
 pub enum DownloadMethod {
@@ -21,11 +38,12 @@ pub enum DownloadMethod {
 pub struct Downloader {
     client: Arc<HttpClient>,
     pub(crate) thread_count: usize,
-    chunk_size: usize,
     pub(crate) method: DownloadMethod,
     pub(crate) aria2c_path: String,
     pub(crate) aria2c_args: Option<String>,
     auth: Option<Auth>,
+    // aria2c 可用性只探测一次，避免每个文件都启动子进程
+    aria2c_available: tokio::sync::OnceCell<bool>,
 }
 
 impl Downloader {
@@ -33,11 +51,11 @@ impl Downloader {
         Self {
             client,
             thread_count,
-            chunk_size: 10 * 1024 * 1024, // 10MB chunks
             method: DownloadMethod::Builtin,
             aria2c_path: "aria2c".to_string(),
             aria2c_args: None,
             auth: None,
+            aria2c_available: tokio::sync::OnceCell::new(),
         }
     }
 
@@ -85,19 +103,17 @@ impl Downloader {
     ) -> Result<()> {
         tracing::info!("Downloading: {} -> {:?}", url, output);
 
-        // Create parent directory if it doesn't exist
-        if let Some(parent) = output.parent() {
-            tokio::fs::create_dir_all(parent).await?;
-        }
+        // 输出目录由调用方负责（create_temp_dir每个页面只建一次），
+        // 这里不再对同一个临时目录逐文件重复mkdir
 
         // Use aria2c if specified
         if self.method == DownloadMethod::Aria2c {
             return self.download_with_aria2c(url, output, progress).await;
         }
 
-        // Try to get file size
-        let file_size = match self.get_file_size(url).await {
-            Ok(size) => size,
+        // Try to get file size and range support with a single HEAD request
+        let (file_size, supports_range) = match self.get_file_info(url).await {
+            Ok(info) => info,
             Err(_) => {
                 tracing::warn!("Could not get file size, downloading without progress");
                 return self.download_simple(url, output).await;
@@ -108,8 +124,7 @@ impl Downloader {
             pb.set_length(file_size);
         }
 
-        // Check if server supports range requests
-        if self.supports_range(url).await && file_size > self.chunk_size as u64 {
+        if supports_range && file_size > CHUNK_SIZE as u64 {
             self.download_chunked(url, output, file_size, progress)
                 .await
         } else {
@@ -118,23 +133,20 @@ impl Downloader {
     }
 
     async fn download_simple(&self, url: &str, output: &Path) -> Result<()> {
-        let mut headers = reqwest::header::HeaderMap::new();
-
         // Add required headers for Bilibili video downloads
-        if url.contains("bilivideo.com") {
-            if let Ok(value) = "https://www.bilibili.com".parse() {
-                headers.insert("Referer", value);
-            }
-            if let Ok(value) =
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36".parse()
-            {
-                headers.insert("User-Agent", value);
-            }
-        }
+        let headers = crate::utils::http::bilivideo_headers(url);
 
         let response = self.client.get(url, Some(headers)).await?;
-        let bytes = response.bytes().await?;
-        tokio::fs::write(output, bytes).await?;
+        // 缓冲写入，小块数据不用每块一次系统调用
+        let mut file = tokio::io::BufWriter::new(File::create(output).await?);
+        let mut stream = response.bytes_stream();
+
+        while let Some(chunk) = stream.next().await {
+            let chunk = chunk.map_err(DownloaderError::Network)?;
+            file.write_all(&chunk).await?;
+        }
+
+        file.flush().await?;
         Ok(())
     }
 
@@ -144,22 +156,12 @@ impl Downloader {
         output: &Path,
         progress: Option<Arc<ProgressBar>>,
     ) -> Result<()> {
-        let mut headers = reqwest::header::HeaderMap::new();
-
         // Add required headers for Bilibili video downloads
-        if url.contains("bilivideo.com") {
-            if let Ok(value) = "https://www.bilibili.com".parse() {
-                headers.insert("Referer", value);
-            }
-            if let Ok(value) =
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36".parse()
-            {
-                headers.insert("User-Agent", value);
-            }
-        }
+        let headers = crate::utils::http::bilivideo_headers(url);
 
         let response = self.client.get(url, Some(headers)).await?;
-        let mut file = File::create(output).await?;
+        // 缓冲写入，小块数据不用每块一次系统调用
+        let mut file = tokio::io::BufWriter::new(File::create(output).await?);
         let mut stream = response.bytes_stream();
         let mut downloaded = 0u64;
 
@@ -177,52 +179,34 @@ impl Downloader {
         Ok(())
     }
 
-    async fn get_file_size(&self, url: &str) -> Result<u64> {
+    /// 一次HEAD请求同时获取文件大小和Range支持情况
+    async fn get_file_info(&self, url: &str) -> Result<(u64, bool)> {
         let mut request = self.client.client.head(url);
 
         // Add required headers for Bilibili video downloads
-        if url.contains("bilivideo.com") {
-            request = request.header("Referer", "https://www.bilibili.com");
-            request = request.header(
-                "User-Agent",
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            );
-        }
+        request = request.headers(crate::utils::http::bilivideo_headers(url));
 
         let response = request.send().await?;
 
-        if let Some(content_length) = response.headers().get("content-length") {
-            let size = content_length
+        let size = if let Some(content_length) = response.headers().get("content-length") {
+            content_length
                 .to_str()
                 .map_err(|_| DownloaderError::Parse("Invalid content-length".to_string()))?
                 .parse::<u64>()
-                .map_err(|_| DownloaderError::Parse("Invalid content-length".to_string()))?;
-            Ok(size)
+                .map_err(|_| DownloaderError::Parse("Invalid content-length".to_string()))?
         } else {
-            Err(DownloaderError::DownloadFailed(
+            return Err(DownloaderError::DownloadFailed(
                 "No content-length header".to_string(),
-            ))
-        }
-    }
-
-    async fn supports_range(&self, url: &str) -> bool {
-        let mut request = self.client.client.head(url);
+            ));
+        };
 
-        // Add required headers for Bilibili video downloads
-        if url.contains("bilivideo.com") {
-            request = request.header("Referer", "https://www.bilibili.com");
-            request = request.header(
-                "User-Agent",
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            );
-        }
+        let supports_range = response
+            .headers()
+            .get("accept-ranges")
+            .map(|v| v.to_str().unwrap_or("") == "bytes")
+            .unwrap_or(false);
 
-        if let Ok(response) = request.send().await {
-            if let Some(accept_ranges) = response.headers().get("accept-ranges") {
-                return accept_ranges.to_str().unwrap_or("") == "bytes";
-            }
-        }
-        false
+        Ok((size, supports_range))
     }
 
     async fn download_chunked(
@@ -232,75 +216,48 @@ impl Downloader {
         total_size: u64,
         progress: Option<Arc<ProgressBar>>,
     ) -> Result<()> {
-        let chunk_count = ((total_size as f64) / (self.chunk_size as f64)).ceil() as usize;
-        let mut tasks = Vec::new();
+        let chunk_count = ((total_size as f64) / (CHUNK_SIZE as f64)).ceil() as usize;
 
-        // Create temp directory for chunks
-        let temp_dir = output.parent().unwrap().join(".rvd_temp");
-        tokio::fs::create_dir_all(&temp_dir).await?;
+        // 基础请求头对同一URL的所有分块都相同，构建一次后按块克隆
+        let base_headers = crate::utils::http::bilivideo_headers(url);
 
-        let mut chunk_paths = Vec::new();
-
-        for i in 0..chunk_count {
-            let start = i * self.chunk_size;
-            let end = std::cmp::min(start + self.chunk_size - 1, total_size as usize - 1);
-            let chunk_path = temp_dir.join(format!("chunk_{}", i));
+        // buffered keeps thread_count downloads in flight at all times and
+        // yields chunks in order, so they can be written straight into the
+        // output file — no per-chunk temp files, merge pass, or cleanup
+        let mut downloads = futures::stream::iter((0..chunk_count).map(|i| {
+            let start = i * CHUNK_SIZE;
+            let end = std::cmp::min(start + CHUNK_SIZE - 1, total_size as usize - 1);
             let url = url.to_string();
             let client = self.client.clone();
             let progress = progress.clone();
+            let mut headers = base_headers.clone();
+
+            async move {
+                headers.insert(
+                    "Range",
+                    format!("bytes={}-{}", start, end).parse().map_err(|_| {
+                        DownloaderError::DownloadFailed("Invalid range header".to_string())
+                    })?,
+                );
 
-            let task = tokio::spawn(async move {
-                client
-                    .download_file(&url, &chunk_path, Some((start as u64, end as u64)))
-                    .await?;
+                let response = client.get(&url, Some(headers)).await?;
+                let bytes = response.bytes().await?;
 
                 if let Some(ref pb) = progress {
-                    pb.inc((end - start + 1) as u64);
+                    pb.inc(bytes.len() as u64);
                 }
 
-                Ok::<_, DownloaderError>(chunk_path)
-            });
-
-            tasks.push(task);
-
-            // Limit concurrent downloads
-            if tasks.len() >= self.thread_count {
-                let completed = futures::future::join_all(tasks.drain(..)).await;
-                for result in completed {
-                    let path = result.map_err(|e| {
-                        DownloaderError::DownloadFailed(format!("Task failed: {}", e))
-                    })??;
-                    chunk_paths.push(path);
-                }
+                Ok::<_, DownloaderError>(bytes)
             }
-        }
+        }))
+        .buffered(self.thread_count);
 
-        // Wait for remaining tasks
-        let completed = futures::future::join_all(tasks).await;
-        for result in completed {
-            let path = result
-                .map_err(|e| DownloaderError::DownloadFailed(format!("Task failed: {}", e)))??;
-            chunk_paths.push(path);
-        }
-
-        // Merge chunks
-        self.merge_chunks(&chunk_paths, output).await?;
-
-        // Cleanup
-        tokio::fs::remove_dir_all(&temp_dir).await?;
-
-        Ok(())
-    }
-
-    async fn merge_chunks(&self, chunks: &[std::path::PathBuf], output: &Path) -> Result<()> {
-        let mut output_file = File::create(output).await?;
-
-        for chunk in chunks {
-            let mut chunk_file = File::open(chunk).await?;
-            tokio::io::copy(&mut chunk_file, &mut output_file).await?;
+        let mut file = tokio::io::BufWriter::new(File::create(output).await?);
+        while let Some(chunk) = downloads.next().await {
+            file.write_all(&chunk?).await?;
         }
+        file.flush().await?;
 
-        output_file.flush().await?;
         Ok(())
     }
 
@@ -313,8 +270,13 @@ impl Downloader {
     ) -> Result<()> {
         tracing::info!("Using aria2c for download");
 
-        // Check if aria2c is available
-        if !self.check_aria2c().await? {
+        // Check if aria2c is available (probed once per downloader)
+        let aria2c_available = *self
+            .aria2c_available
+            .get_or_init(|| async { self.check_aria2c().await.unwrap_or(false) })
+            .await;
+
+        if !aria2c_available {
             tracing::warn!("aria2c not found, falling back to built-in downloader");
             // Fall back to built-in streaming download
             return self.download_streaming(url, output, progress).await;
@@ -329,32 +291,27 @@ impl Downloader {
             .to_str()
             .ok_or_else(|| DownloaderError::DownloadFailed("Invalid output filename".to_string()))?;
 
-        // Build aria2c command
-        let mut args = vec![
-            // Basic options
-            "--auto-file-renaming=false".to_string(),
-            "--download-result=hide".to_string(),
-            "--allow-overwrite=true".to_string(),
-            "--console-log-level=warn".to_string(),
-            // Connection options (matching BBDown defaults)
-            "-x16".to_string(), // max connections per server
-            "-s16".to_string(), // split into 16 parts
-            "-j16".to_string(), // max concurrent downloads
-            "-k5M".to_string(), // min split size 5MB
-        ];
+        // Build aria2c command（固定参数直接借用，只有Cookie头需要按调用拼接）
+        use std::borrow::Cow;
+
+        let mut args: Vec<Cow<'_, str>> = ARIA2C_BASE_ARGS
+            .iter()
+            .map(|&arg| Cow::Borrowed(arg))
+            .collect();
 
         // Add headers for Bilibili
         if url.contains("bilivideo.com") {
             // Only add Referer for non-TV/APP API URLs
-            if !url.contains("platform=android_tv_yst") && !url.contains("platform=android") {
-                args.push("--header=Referer: https://www.bilibili.com".to_string());
+            // （platform=android 同时覆盖 platform=android_tv_yst，不用扫第二遍）
+            if !url.contains("platform=android") {
+                args.push(Cow::Borrowed("--header=Referer: https://www.bilibili.com"));
             }
-            args.push("--header=User-Agent: Mozilla/5.0".to_string());
+            args.push(Cow::Borrowed("--header=User-Agent: Mozilla/5.0"));
 
             // Add cookie if available
             if let Some(ref auth) = self.auth {
                 if let Some(ref cookie) = auth.cookie {
-                    args.push(format!("--header=Cookie: {}", cookie));
+                    args.push(Cow::Owned(format!("--header=Cookie: {}", cookie)));
                 }
             }
         }
@@ -362,29 +319,24 @@ impl Downloader {
         // Add custom args if provided
         if let Some(ref custom_args) = self.aria2c_args {
             for arg in custom_args.split_whitespace() {
-                args.push(arg.to_string());
+                args.push(Cow::Borrowed(arg));
             }
         }
 
         // Add URL and output options
-        args.push(url.to_string());
-        args.push("-d".to_string());
-        args.push(
-            output_dir
-                .to_str()
-                .ok_or_else(|| {
-                    DownloaderError::DownloadFailed("Invalid output directory".to_string())
-                })?
-                .to_string(),
-        );
-        args.push("-o".to_string());
-        args.push(output_filename.to_string());
+        args.push(Cow::Borrowed(url));
+        args.push(Cow::Borrowed("-d"));
+        args.push(Cow::Borrowed(output_dir.to_str().ok_or_else(|| {
+            DownloaderError::DownloadFailed("Invalid output directory".to_string())
+        })?));
+        args.push(Cow::Borrowed("-o"));
+        args.push(Cow::Borrowed(output_filename));
 
         tracing::debug!("aria2c command: {} {}", self.aria2c_path, args.join(" "));
 
         // Execute aria2c
         let output_result = Command::new(&self.aria2c_path)
-            .args(&args)
+            .args(args.iter().map(|arg| arg.as_ref()))
             .output()
             .await
             .map_err(|e| {
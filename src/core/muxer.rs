@@ -34,6 +34,16 @@ impl Muxer {
         Ok(muxer)
     }
 
+    /// 创建不立即探测ffmpeg的实例
+    /// 用于 info-only / skip-mux 等不会混流的场景，省掉启动时的子进程探测
+    pub fn new_unchecked(ffmpeg_path: Option<PathBuf>, use_mp4box: bool) -> Self {
+        Self {
+            ffmpeg_path: ffmpeg_path.unwrap_or_else(|| PathBuf::from("ffmpeg")),
+            ffmpeg_version: None,
+            use_mp4box,
+        }
+    }
+
     pub fn check_ffmpeg(&mut self) -> Result<String> {
         let output = Command::new(&self.ffmpeg_path)
             .arg("-version")
@@ -151,7 +161,10 @@ impl Muxer {
             // TODO: 实现mp4box混流逻辑
         }
 
-        let mut cmd = Command::new(&self.ffmpeg_path);
+        // 异步执行ffmpeg，混流期间不阻塞tokio工作线程
+        let mut cmd = tokio::process::Command::new(&self.ffmpeg_path);
+        // 只输出错误信息，避免把ffmpeg的进度/统计日志整段缓冲在内存里
+        cmd.arg("-hide_banner").arg("-loglevel").arg("error");
         cmd.arg("-i").arg(video);
         cmd.arg("-i").arg(audio);
 
@@ -193,6 +206,7 @@ impl Muxer {
 
         let output_result = cmd
             .output()
+            .await
             .map_err(|e| DownloaderError::MuxFailed(format!("Failed to execute ffmpeg: {}", e)))?;
 
         // 清理章节文件
@@ -1,6 +1,17 @@
 use indicatif::{MultiProgress, ProgressBar, ProgressStyle};
 use std::collections::HashMap;
-use std::sync::{Arc, Mutex};
+use std::sync::{Arc, Mutex, OnceLock};
+
+/// 进度条样式模板只解析一次，后续创建进度条时直接克隆
+fn bar_style() -> &'static ProgressStyle {
+    static STYLE: OnceLock<ProgressStyle> = OnceLock::new();
+    STYLE.get_or_init(|| {
+        ProgressStyle::default_bar()
+            .template("{msg}\n{spinner:.green} [{elapsed_precise}] [{wide_bar:.cyan/blue}] {bytes}/{total_bytes} ({bytes_per_sec}, {eta})")
+            .expect("Failed to set progress style")
+            .progress_chars("#>-")
+    })
+}
 
 pub struct ProgressTracker {
     bars: Arc<Mutex<HashMap<String, ProgressBar>>>,
@@ -17,12 +28,7 @@ impl ProgressTracker {
 
     pub fn create_bar(&self, id: &str, total: u64) -> Arc<ProgressBar> {
         let pb = self.multi_progress.add(ProgressBar::new(total));
-        pb.set_style(
-            ProgressStyle::default_bar()
-                .template("{msg}\n{spinner:.green} [{elapsed_precise}] [{wide_bar:.cyan/blue}] {bytes}/{total_bytes} ({bytes_per_sec}, {eta})")
-                .expect("Failed to set progress style")
-                .progress_chars("#>-"),
-        );
+        pb.set_style(bar_style().clone());
         pb.set_message(id.to_string());
 
         let pb_arc = Arc::new(pb.clone());
@@ -30,10 +30,10 @@ pub async fn download_and_convert_subtitle(
 
     // Download subtitle JSON
     let response = client.get(&subtitle.url, None).await?;
-    let json_text = response.text().await?;
+    let body = response.bytes().await?;
 
     // Parse JSON
-    let bili_subtitle: BilibiliSubtitle = serde_json::from_str(&json_text)
+    let bili_subtitle: BilibiliSubtitle = serde_json::from_slice(&body)
         .map_err(|e| DownloaderError::Parse(format!("Failed to parse subtitle: {}", e)))?;
 
     // Convert to SRT format
@@ -47,16 +47,19 @@ pub async fn download_and_convert_subtitle(
 }
 
 fn convert_to_srt(subtitle: &BilibiliSubtitle) -> String {
-    let mut srt = String::new();
+    use std::fmt::Write;
+
+    // 预估容量：每条字幕约需时间轴行 + 内容行
+    let mut srt = String::with_capacity(subtitle.body.len() * 64);
 
     for (index, item) in subtitle.body.iter().enumerate() {
         // Subtitle index (1-based)
-        srt.push_str(&format!("{}\n", index + 1));
+        let _ = writeln!(srt, "{}", index + 1);
 
         // Timestamp
         let start = format_timestamp(item.from);
         let end = format_timestamp(item.to);
-        srt.push_str(&format!("{} --> {}\n", start, end));
+        let _ = writeln!(srt, "{} --> {}", start, end);
 
         // Content
         srt.push_str(&item.content);
@@ -67,10 +70,13 @@ fn convert_to_srt(subtitle: &BilibiliSubtitle) -> String {
 }
 
 fn format_timestamp(seconds: f64) -> String {
-    let hours = (seconds / 3600.0).floor() as u32;
-    let minutes = ((seconds % 3600.0) / 60.0).floor() as u32;
-    let secs = (seconds % 60.0).floor() as u32;
-    let millis = ((seconds % 1.0) * 1000.0).floor() as u32;
+    // 一次换算成毫秒后全部用整数运算，省掉逐字段的浮点取模
+    let total_millis = (seconds * 1000.0) as u64;
+    let millis = total_millis % 1000;
+    let total_secs = total_millis / 1000;
+    let hours = total_secs / 3600;
+    let minutes = (total_secs % 3600) / 60;
+    let secs = total_secs % 60;
 
     format!("{:02}:{:02}:{:02},{:03}", hours, minutes, secs, millis)
 }
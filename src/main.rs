@@ -39,16 +39,19 @@ async fn run() -> Result<(), DownloaderError> {
 
     // Handle login if requested and get credentials
     let login_auth = if cli.needs_login() {
-        Some(handle_login(&cli).await?)
+        let http_client = std::sync::Arc::new(utils::http::HttpClient::new()?);
+        let auth = handle_login(&cli, http_client.clone()).await?;
+
+        // If login was performed without a URL, just exit successfully
+        if cli.url.is_none() {
+            return Ok(());
+        }
+
+        Some((auth, http_client))
     } else {
         None
     };
 
-    // If login was performed without a URL, just exit successfully
-    if cli.needs_login() && cli.url.is_none() {
-        return Ok(());
-    }
-
     // Load configuration
     let config = if let Some(ref config_path) = cli.config_file {
         Config::load(config_path)?
@@ -57,12 +60,15 @@ async fn run() -> Result<(), DownloaderError> {
     };
 
     // Create orchestrator with login auth if available
-    let mut orchestrator = Orchestrator::new(config, &cli)?;
-    
-    // If we have login auth, it takes priority
-    if let Some(auth) = login_auth {
-        orchestrator.set_auth(Some(auth));
-    }
+    // (reuse the login HTTP client instead of building a second one)
+    let orchestrator = match login_auth {
+        Some((auth, http_client)) => {
+            let mut orchestrator = Orchestrator::with_http_client(config, &cli, http_client)?;
+            orchestrator.set_auth(Some(auth));
+            orchestrator
+        }
+        None => Orchestrator::new(config, &cli)?,
+    };
 
     // Run the download
     orchestrator.run(cli).await?;
@@ -70,12 +76,13 @@ async fn run() -> Result<(), DownloaderError> {
     Ok(())
 }
 
-async fn handle_login(cli: &Cli) -> Result<crate::types::Auth, DownloaderError> {
+async fn handle_login(
+    cli: &Cli,
+    http_client: std::sync::Arc<utils::http::HttpClient>,
+) -> Result<crate::types::Auth, DownloaderError> {
     use auth::login::LoginManager;
     use auth::providers::BilibiliAuthProvider;
     use auth::storage::CredentialStorage;
-    use utils::http::HttpClient;
-    use std::sync::Arc;
 
     tracing::info!("Starting login process...");
 
@@ -83,9 +90,6 @@ async fn handle_login(cli: &Cli) -> Result<crate::types::Auth, DownloaderError>
     let api_mode = cli.get_login_api_mode()
         .ok_or_else(|| DownloaderError::Config("No login mode specified".to_string()))?;
 
-    // Create HTTP client
-    let http_client = Arc::new(HttpClient::new()?);
-
     // Create auth provider
     let provider = Box::new(BilibiliAuthProvider::new(http_client, api_mode));
 
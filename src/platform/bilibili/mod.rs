@@ -10,6 +10,7 @@ use crate::utils::http::HttpClient;
 use async_trait::async_trait;
 use regex::Regex;
 use std::sync::Arc;
+use std::sync::OnceLock;
 
 /// Result of parsing a video URL - can be either a single video or a batch of videos
 #[derive(Debug)]
@@ -53,79 +54,69 @@ impl BilibiliPlatform {
     }
 
     pub fn with_api_mode(api_mode: ApiMode) -> Result<Self> {
-        let client = Arc::new(HttpClient::new()?);
+        Ok(Self::with_client(Arc::new(HttpClient::new()?), api_mode))
+    }
+
+    /// 复用调用方的HTTP客户端，共享连接池
+    pub fn with_client(client: Arc<HttpClient>, api_mode: ApiMode) -> Self {
         let wbi_manager = wbi::WbiManager::new(client.clone());
-        Ok(Self {
+        Self {
             client,
             api_mode,
             wbi_manager: tokio::sync::Mutex::new(wbi_manager),
-        })
+        }
     }
 
     fn parse_url(&self, url: &str) -> Result<VideoType> {
-        // BV号: BV1xx411c7mD 或 https://www.bilibili.com/video/BV1xx411c7mD
-        let bv_regex = Regex::new(r"(BV[a-zA-Z0-9]+)").unwrap();
-        if let Some(caps) = bv_regex.captures(url) {
-            return Ok(VideoType::Bvid(caps[1].to_string()));
-        }
-
-        // av号: av170001 或 https://www.bilibili.com/video/av170001
-        let av_regex = Regex::new(r"av(\d+)").unwrap();
-        if let Some(caps) = av_regex.captures(url) {
-            return Ok(VideoType::Aid(caps[1].to_string()));
-        }
-
-        // 番剧 ep: ep123456 或 https://www.bilibili.com/bangumi/play/ep123456
-        let ep_regex = Regex::new(r"ep(\d+)").unwrap();
-        if let Some(caps) = ep_regex.captures(url) {
-            return Ok(VideoType::Episode(caps[1].to_string()));
-        }
-
-        // 番剧 ss: ss12345 或 https://www.bilibili.com/bangumi/play/ss12345
-        let ss_regex = Regex::new(r"ss(\d+)").unwrap();
-        if let Some(caps) = ss_regex.captures(url) {
-            return Ok(VideoType::Season(caps[1].to_string()));
-        }
-
-        // 课程: cheese123456 或 https://www.bilibili.com/cheese/play/ep123456
-        let cheese_regex = Regex::new(r"cheese/play/ep(\d+)").unwrap();
-        if let Some(caps) = cheese_regex.captures(url) {
-            return Ok(VideoType::Cheese(caps[1].to_string()));
-        }
-
-        // 收藏夹: favId:mid 或 https://space.bilibili.com/{mid}/favlist?fid={favId}
-        let fav_regex = Regex::new(r"space\.bilibili\.com/(\d+)/favlist\?fid=(\d+)").unwrap();
-        if let Some(caps) = fav_regex.captures(url) {
-            let mid = caps[1].to_string();
-            let fav_id = caps[2].to_string();
-            return Ok(VideoType::FavoriteList(format!("{}:{}", fav_id, mid)));
-        }
-
-        // UP主空间: mid123456 或 https://space.bilibili.com/123456
-        let space_regex = Regex::new(r"space\.bilibili\.com/(\d+)").unwrap();
-        if let Some(caps) = space_regex.captures(url) {
-            return Ok(VideoType::SpaceVideo(caps[1].to_string()));
-        }
-
-        // 合集: https://www.bilibili.com/medialist/play/ml123456
-        let media_regex = Regex::new(r"medialist/play/ml(\d+)").unwrap();
-        if let Some(caps) = media_regex.captures(url) {
-            return Ok(VideoType::MediaList(caps[1].to_string()));
-        }
-
-        // 系列: https://space.bilibili.com/{mid}/channel/seriesdetail?sid={sid}
-        let series_regex =
-            Regex::new(r"space\.bilibili\.com/(\d+)/channel/seriesdetail\?sid=(\d+)").unwrap();
-        if let Some(caps) = series_regex.captures(url) {
-            let mid = caps[1].to_string();
-            let sid = caps[2].to_string();
-            return Ok(VideoType::SeriesList(format!("{}:{}", mid, sid)));
-        }
-
-        Err(DownloaderError::InvalidUrl(format!(
-            "Cannot parse bilibili URL: {}",
-            url
-        )))
+        // 模式顺序即匹配优先级（与原先逐个尝试的顺序一致）
+        const URL_PATTERNS: [&str; 9] = [
+            r"(BV[a-zA-Z0-9]+)",                              // BV号: BV1xx411c7mD
+            r"av(\d+)",                                       // av号: av170001
+            r"ep(\d+)",                                       // 番剧 ep: ep123456
+            r"ss(\d+)",                                       // 番剧 ss: ss12345
+            r"cheese/play/ep(\d+)",                           // 课程
+            r"space\.bilibili\.com/(\d+)/favlist\?fid=(\d+)", // 收藏夹
+            r"space\.bilibili\.com/(\d+)",                    // UP主空间
+            r"medialist/play/ml(\d+)",                        // 合集
+            r"space\.bilibili\.com/(\d+)/channel/seriesdetail\?sid=(\d+)", // 系列
+        ];
+
+        static URL_SET: OnceLock<regex::RegexSet> = OnceLock::new();
+        static URL_REGEXES: OnceLock<Vec<Regex>> = OnceLock::new();
+
+        // RegexSet一次扫描URL找出所有命中的模式，取索引最小（优先级最高）的
+        let set = URL_SET.get_or_init(|| regex::RegexSet::new(URL_PATTERNS).unwrap());
+        let index = match set.matches(url).iter().next() {
+            Some(index) => index,
+            None => {
+                return Err(DownloaderError::InvalidUrl(format!(
+                    "Cannot parse bilibili URL: {}",
+                    url
+                )))
+            }
+        };
+
+        // 只对命中的那个模式提取捕获组
+        let regexes = URL_REGEXES
+            .get_or_init(|| URL_PATTERNS.iter().map(|p| Regex::new(p).unwrap()).collect());
+        let caps = regexes[index]
+            .captures(url)
+            .expect("RegexSet matched, captures must succeed");
+
+        Ok(match index {
+            0 => VideoType::Bvid(caps[1].to_string()),
+            1 => VideoType::Aid(caps[1].to_string()),
+            2 => VideoType::Episode(caps[1].to_string()),
+            3 => VideoType::Season(caps[1].to_string()),
+            4 => VideoType::Cheese(caps[1].to_string()),
+            // favId:mid
+            5 => VideoType::FavoriteList(format!("{}:{}", &caps[2], &caps[1])),
+            6 => VideoType::SpaceVideo(caps[1].to_string()),
+            7 => VideoType::MediaList(caps[1].to_string()),
+            // mid:sid
+            8 => VideoType::SeriesList(format!("{}:{}", &caps[1], &caps[2])),
+            _ => unreachable!(),
+        })
     }
 }
 
@@ -136,17 +127,17 @@ impl Platform for BilibiliPlatform {
     }
     
     fn can_handle(&self, url: &str) -> bool {
-        url.contains("bilibili.com")
-            || url.contains("b23.tv")
-            || url.starts_with("BV")
-            || url.starts_with("av")
-            || url.starts_with("ep")
-            || url.starts_with("ss")
-            || url.contains("cheese")
-            || url.contains("favlist")
-            || url.contains("space.bilibili.com")
-            || url.contains("medialist")
-            || url.contains("seriesdetail")
+        // 所有特征合成一个预编译的多模式正则，单趟扫描代替逐个contains
+        // （space.bilibili.com 已被 bilibili.com 覆盖，裸ID前缀用 ^ 锚定）
+        static HANDLE_REGEX: OnceLock<Regex> = OnceLock::new();
+        HANDLE_REGEX
+            .get_or_init(|| {
+                Regex::new(
+                    r"bilibili\.com|b23\.tv|^(?:BV|av|ep|ss)|cheese|favlist|medialist|seriesdetail",
+                )
+                .unwrap()
+            })
+            .is_match(url)
     }
 
     async fn parse_video(&self, url: &str, auth: Option<&Auth>) -> Result<VideoInfo> {
@@ -7,19 +7,42 @@ use crate::types::{Auth, Page, Stream, StreamType, Subtitle, VideoInfo};
 use crate::utils::http::HttpClient;
 use std::sync::Arc;
 
-const QUALITY_MAP: &[(&str, u32)] = &[
-    ("8K 超高清", 127),
-    ("杜比视界", 126),
-    ("HDR 真彩", 125),
-    ("4K 超清", 120),
-    ("1080P 60帧", 116),
-    ("1080P 高码率", 112),
-    ("1080P 高清", 80),
-    ("720P 60帧", 74),
-    ("720P 高清", 64),
-    ("480P 清晰", 32),
-    ("360P 流畅", 16),
-];
+// 批量解析时并发获取视频详情的数量上限
+const DETAIL_FETCH_CONCURRENCY: usize = 4;
+
+
+/// 解析标准 ApiResponse 包装：反序列化、校验 code 并取出 data
+fn parse_api_data<T: serde::de::DeserializeOwned>(body: &[u8], context: &str) -> Result<Option<T>> {
+    let api_response: ApiResponse<T> = serde_json::from_slice(body)
+        .map_err(|e| DownloaderError::Parse(format!("Failed to parse {}: {}", context, e)))?;
+
+    if api_response.code != 0 {
+        return Err(DownloaderError::Api(format!(
+            "API error: {}",
+            api_response.message
+        )));
+    }
+
+    Ok(api_response.data)
+}
+
+/// 同 parse_api_data，但用于携带 result 字段的番剧接口包装
+fn parse_bangumi_result<T: serde::de::DeserializeOwned>(
+    body: &[u8],
+    context: &str,
+) -> Result<Option<T>> {
+    let api_response: super::api::BangumiApiResponse<T> = serde_json::from_slice(body)
+        .map_err(|e| DownloaderError::Parse(format!("Failed to parse {}: {}", context, e)))?;
+
+    if api_response.code != 0 {
+        return Err(DownloaderError::Api(format!(
+            "API error: {}",
+            api_response.message
+        )));
+    }
+
+    Ok(api_response.result)
+}
 
 pub async fn parse_video_info(
     client: &Arc<HttpClient>,
@@ -80,22 +103,11 @@ async fn fetch_video_info_by_bvid(
         bvid
     );
     let response = client.get_with_auth(&api, auth).await?;
-    let json_text = response.text().await?;
-
-    tracing::debug!("Video info response: {}", json_text);
+    let body = response.bytes().await?;
 
-    let api_response: ApiResponse<VideoInfoData> = serde_json::from_str(&json_text)
-        .map_err(|e| DownloaderError::Parse(format!("Failed to parse video info: {}", e)))?;
-
-    if api_response.code != 0 {
-        return Err(DownloaderError::Api(format!(
-            "API error: {}",
-            api_response.message
-        )));
-    }
+    tracing::debug!("Video info response: {}", String::from_utf8_lossy(&body));
 
-    let data = api_response
-        .data
+    let data = parse_api_data::<VideoInfoData>(&body, "video info")?
         .ok_or_else(|| DownloaderError::VideoNotFound(bvid.to_string()))?;
 
     convert_to_video_info(data)
@@ -108,22 +120,11 @@ async fn fetch_video_info_by_aid(
 ) -> Result<VideoInfo> {
     let api = format!("https://api.bilibili.com/x/web-interface/view?aid={}", aid);
     let response = client.get_with_auth(&api, auth).await?;
-    let json_text = response.text().await?;
-
-    tracing::debug!("Video info response: {}", json_text);
-
-    let api_response: ApiResponse<VideoInfoData> = serde_json::from_str(&json_text)
-        .map_err(|e| DownloaderError::Parse(format!("Failed to parse video info: {}", e)))?;
+    let body = response.bytes().await?;
 
-    if api_response.code != 0 {
-        return Err(DownloaderError::Api(format!(
-            "API error: {}",
-            api_response.message
-        )));
-    }
+    tracing::debug!("Video info response: {}", String::from_utf8_lossy(&body));
 
-    let data = api_response
-        .data
+    let data = parse_api_data::<VideoInfoData>(&body, "video info")?
         .ok_or_else(|| DownloaderError::VideoNotFound(aid.to_string()))?;
 
     convert_to_video_info(data)
@@ -236,45 +237,26 @@ pub async fn get_play_url_with_mode_and_ep(
     };
 
     let response = client.get_with_auth(&api, auth).await?;
-    let json_text = response.text().await?;
+    let body = response.bytes().await?;
 
-    tracing::debug!("Play URL response: {}", json_text);
+    tracing::debug!("Play URL response: {}", String::from_utf8_lossy(&body));
 
     // 番剧API返回result字段，普通视频返回data字段
     let data = if is_bangumi {
-        let api_response: super::api::BangumiApiResponse<super::api::BangumiPlayUrlResult> = serde_json::from_str(&json_text)
-            .map_err(|e| DownloaderError::Parse(format!("Failed to parse bangumi play URL: {}", e)))?;
-
-        if api_response.code != 0 {
-            return Err(DownloaderError::Api(format!(
-                "API error: {}",
-                api_response.message
-            )));
-        }
-
-        api_response
-            .result
+        parse_bangumi_result::<super::api::BangumiPlayUrlResult>(&body, "bangumi play URL")?
             .ok_or_else(|| DownloaderError::DownloadFailed("No play URL data".to_string()))?
             .video_info
     } else {
-        let api_response: ApiResponse<PlayUrlData> = serde_json::from_str(&json_text)
-            .map_err(|e| DownloaderError::Parse(format!("Failed to parse play URL: {}", e)))?;
-
-        if api_response.code != 0 {
-            return Err(DownloaderError::Api(format!(
-                "API error: {}",
-                api_response.message
-            )));
-        }
-
-        api_response
-            .data
+        parse_api_data::<PlayUrlData>(&body, "play URL")?
             .ok_or_else(|| DownloaderError::DownloadFailed("No play URL data".to_string()))?
     };
 
     let mut streams = Vec::new();
 
     if let Some(dash) = data.dash {
+        // 按已知流数量一次性预留容量（杜比/Hi-Res最多各占一组），避免push过程中反复扩容
+        streams.reserve(dash.video.len() + dash.audio.len() + 2);
+
         // DASH format (separate video and audio)
         for video in dash.video {
             let quality_name = get_quality_name(video.id);
@@ -285,7 +267,7 @@ pub async fn get_play_url_with_mode_and_ep(
                 quality: quality_name.to_string(),
                 quality_id: video.id,
                 codec: codec.to_string(),
-                url: video.base_url.clone(),
+                url: video.base_url,
                 size: 0, // Size not provided in API
                 bandwidth: video.bandwidth,
             });
@@ -309,7 +291,7 @@ pub async fn get_play_url_with_mode_and_ep(
                 quality: format!("{}kbps", audio.bandwidth / 1000),
                 quality_id: audio.id,
                 codec: codec.to_string(),
-                url: audio.base_url.clone(),
+                url: audio.base_url,
                 size: 0,
                 bandwidth: audio.bandwidth,
             });
@@ -333,7 +315,7 @@ pub async fn get_play_url_with_mode_and_ep(
                         quality: format!("{}kbps (Dolby)", audio.bandwidth / 1000),
                         quality_id: audio.id,
                         codec: codec.to_string(),
-                        url: audio.base_url.clone(),
+                        url: audio.base_url,
                         size: 0,
                         bandwidth: audio.bandwidth,
                     });
@@ -358,7 +340,7 @@ pub async fn get_play_url_with_mode_and_ep(
                     quality: format!("{}kbps (Hi-Res)", flac_audio.bandwidth / 1000),
                     quality_id: flac_audio.id,
                     codec: codec.to_string(),
-                    url: flac_audio.base_url.clone(),
+                    url: flac_audio.base_url,
                     size: 0,
                     bandwidth: flac_audio.bandwidth,
                 });
@@ -386,11 +368,11 @@ pub async fn get_subtitles(
     );
 
     let response = client.get(&api, None).await?;
-    let json_text = response.text().await?;
+    let body = response.bytes().await?;
 
-    tracing::debug!("Subtitle response: {}", json_text);
+    tracing::debug!("Subtitle response: {}", String::from_utf8_lossy(&body));
 
-    let api_response: ApiResponse<SubtitleData> = serde_json::from_str(&json_text)
+    let api_response: ApiResponse<SubtitleData> = serde_json::from_slice(&body)
         .map_err(|e| DownloaderError::Parse(format!("Failed to parse subtitles: {}", e)))?;
 
     if api_response.code != 0 {
@@ -422,12 +404,20 @@ pub async fn get_subtitles(
 }
 
 fn get_quality_name(quality_id: u32) -> &'static str {
-    for (name, id) in QUALITY_MAP {
-        if *id == quality_id {
-            return name;
-        }
+    match quality_id {
+        127 => "8K 超高清",
+        126 => "杜比视界",
+        125 => "HDR 真彩",
+        120 => "4K 超清",
+        116 => "1080P 60帧",
+        112 => "1080P 高码率",
+        80 => "1080P 高清",
+        74 => "720P 60帧",
+        64 => "720P 高清",
+        32 => "480P 清晰",
+        16 => "360P 流畅",
+        _ => "Unknown",
     }
-    "Unknown"
 }
 
 fn get_codec_name(codec_id: u32) -> &'static str {
@@ -454,22 +444,11 @@ async fn fetch_bangumi_info_by_ep(
 ) -> Result<VideoInfo> {
     let api = format!("https://api.bilibili.com/pgc/view/web/season?ep_id={}", ep_id);
     let response = client.get_with_auth(&api, auth).await?;
-    let json_text = response.text().await?;
+    let body = response.bytes().await?;
 
-    tracing::debug!("Bangumi info response: {}", json_text);
+    tracing::debug!("Bangumi info response: {}", String::from_utf8_lossy(&body));
 
-    let api_response: super::api::BangumiApiResponse<BangumiInfoData> = serde_json::from_str(&json_text)
-        .map_err(|e| DownloaderError::Parse(format!("Failed to parse bangumi info: {}", e)))?;
-
-    if api_response.code != 0 {
-        return Err(DownloaderError::Api(format!(
-            "API error: {}",
-            api_response.message
-        )));
-    }
-
-    let data = api_response
-        .result
+    let data = parse_bangumi_result::<BangumiInfoData>(&body, "bangumi info")?
         .ok_or_else(|| DownloaderError::VideoNotFound(format!("ep{}", ep_id)))?;
 
     convert_bangumi_to_video_info(data, ep_id)
@@ -483,22 +462,11 @@ async fn fetch_bangumi_info_by_ss(
 ) -> Result<VideoInfo> {
     let api = format!("https://api.bilibili.com/pgc/view/web/season?season_id={}", season_id);
     let response = client.get_with_auth(&api, auth).await?;
-    let json_text = response.text().await?;
-
-    tracing::debug!("Bangumi info response: {}", json_text);
+    let body = response.bytes().await?;
 
-    let api_response: super::api::BangumiApiResponse<BangumiInfoData> = serde_json::from_str(&json_text)
-        .map_err(|e| DownloaderError::Parse(format!("Failed to parse bangumi info: {}", e)))?;
+    tracing::debug!("Bangumi info response: {}", String::from_utf8_lossy(&body));
 
-    if api_response.code != 0 {
-        return Err(DownloaderError::Api(format!(
-            "API error: {}",
-            api_response.message
-        )));
-    }
-
-    let data = api_response
-        .result
+    let data = parse_bangumi_result::<BangumiInfoData>(&body, "bangumi info")?
         .ok_or_else(|| DownloaderError::VideoNotFound(format!("ss{}", season_id)))?;
 
     convert_bangumi_to_video_info(data, "")
@@ -529,7 +497,12 @@ fn convert_bangumi_to_video_info(data: BangumiInfoData, target_ep_id: &str) -> R
             continue;
         }
 
-        let ep_title = format!("{} {}", episode.title, episode.long_title).trim().to_string();
+        // 按需拼接，避免format出整串后trim再整份复制一次
+        let ep_title = match (episode.title.trim(), episode.long_title.trim()) {
+            (title, "") => title.to_string(),
+            ("", long_title) => long_title.to_string(),
+            (title, long_title) => format!("{} {}", title, long_title),
+        };
         let current_ep_id = episode.id.to_string();
 
         // 保存第一个episode的ep_id
@@ -580,22 +553,11 @@ async fn fetch_cheese_info(
 ) -> Result<VideoInfo> {
     let api = format!("https://api.bilibili.com/pugv/view/web/season?ep_id={}", ep_id);
     let response = client.get_with_auth(&api, auth).await?;
-    let json_text = response.text().await?;
-
-    tracing::debug!("Cheese info response: {}", json_text);
+    let body = response.bytes().await?;
 
-    let api_response: ApiResponse<CheeseInfoData> = serde_json::from_str(&json_text)
-        .map_err(|e| DownloaderError::Parse(format!("Failed to parse cheese info: {}", e)))?;
-
-    if api_response.code != 0 {
-        return Err(DownloaderError::Api(format!(
-            "API error: {}",
-            api_response.message
-        )));
-    }
+    tracing::debug!("Cheese info response: {}", String::from_utf8_lossy(&body));
 
-    let data = api_response
-        .data
+    let data = parse_api_data::<CheeseInfoData>(&body, "cheese info")?
         .ok_or_else(|| DownloaderError::VideoNotFound(format!("cheese/ep{}", ep_id)))?;
 
     convert_cheese_to_video_info(data)
@@ -658,7 +620,7 @@ pub async fn fetch_favorite_list(
             mid
         );
         let response = client.get_with_auth(&api, auth).await?;
-        let json_text = response.text().await?;
+        let body = response.bytes().await?;
 
         #[derive(Deserialize)]
         struct FavListData {
@@ -669,7 +631,7 @@ pub async fn fetch_favorite_list(
             id: u64,
         }
 
-        let response: ApiResponse<FavListData> = serde_json::from_str(&json_text)
+        let response: ApiResponse<FavListData> = serde_json::from_slice(&body)
             .map_err(|e| DownloaderError::Parse(format!("Failed to parse fav list: {}", e)))?;
 
         response
@@ -689,22 +651,11 @@ pub async fn fetch_favorite_list(
         fav_id, page_size
     );
     let response = client.get_with_auth(&api, auth).await?;
-    let json_text = response.text().await?;
-
-    tracing::debug!("Favorite list response: {}", json_text);
+    let body = response.bytes().await?;
 
-    let api_response: ApiResponse<FavoriteListData> = serde_json::from_str(&json_text)
-        .map_err(|e| DownloaderError::Parse(format!("Failed to parse favorite list: {}", e)))?;
+    tracing::debug!("Favorite list response: {}", String::from_utf8_lossy(&body));
 
-    if api_response.code != 0 {
-        return Err(DownloaderError::Api(format!(
-            "API error: {}",
-            api_response.message
-        )));
-    }
-
-    let data = api_response
-        .data
+    let data = parse_api_data::<FavoriteListData>(&body, "favorite list")?
         .ok_or_else(|| DownloaderError::Parse("No favorite list data".to_string()))?;
 
     let total_count = data.info.media_count;
@@ -712,91 +663,32 @@ pub async fn fetch_favorite_list(
 
     // 处理第一页的媒体
     if let Some(medias) = data.medias {
-        for media in medias {
-            // 只处理未失效的视频
-            if media.attr != 0 {
-                continue;
-            }
-
-            if media.page > 1 {
-                // 多P视频，需要获取详细信息
-                let video_info = fetch_video_info_by_aid(client, &media.id.to_string(), auth).await?;
-                all_videos.push(video_info);
-            } else {
-                // 单P视频
-                let title = media.title.clone();
-                let video_info = VideoInfo {
-                    id: format!("av{}", media.id),
-                    aid: media.id,
-                    title: title.clone(),
-                    description: media.intro,
-                    duration: media.duration,
-                    uploader: media.upper.name,
-                    uploader_mid: media.upper.mid.to_string(),
-                    upload_date: format_timestamp(media.pubtime as u64),
-                    cover_url: media.cover,
-                    pages: vec![Page {
-                        number: 1,
-                        title,
-                        cid: media.ugc.as_ref().map(|u| u.first_cid.to_string()).unwrap_or_default(),
-                        duration: media.duration,
-                        ep_id: None,
-                    }],
-                    is_bangumi: false,
-                    ep_id: None,
-                };
-                all_videos.push(video_info);
-            }
-        }
+        append_favorite_medias(client, medias, auth, &mut all_videos).await?;
     }
 
-    // 获取剩余页面
-    for page in 2..=total_pages {
+    // 获取剩余页面（页请求并发进行，结果仍按页序处理）
+    use futures::StreamExt;
+    let mut page_bodies = futures::stream::iter((2..=total_pages).map(|page| {
         let api = format!(
             "https://api.bilibili.com/x/v3/fav/resource/list?media_id={}&pn={}&ps={}&order=mtime&type=2&tid=0&platform=web",
             fav_id, page, page_size
         );
-        let response = client.get_with_auth(&api, auth).await?;
-        let json_text = response.text().await?;
+        async move {
+            let response = client.get_with_auth(&api, auth).await?;
+            Ok::<_, DownloaderError>(response.bytes().await?)
+        }
+    }))
+    .buffered(DETAIL_FETCH_CONCURRENCY);
+
+    while let Some(body) = page_bodies.next().await {
+        let body = body?;
 
-        let api_response: ApiResponse<FavoriteListData> = serde_json::from_str(&json_text)
+        let api_response: ApiResponse<FavoriteListData> = serde_json::from_slice(&body)
             .map_err(|e| DownloaderError::Parse(format!("Failed to parse favorite list: {}", e)))?;
 
         if let Some(data) = api_response.data {
             if let Some(medias) = data.medias {
-                for media in medias {
-                    if media.attr != 0 {
-                        continue;
-                    }
-
-                    if media.page > 1 {
-                        let video_info = fetch_video_info_by_aid(client, &media.id.to_string(), auth).await?;
-                        all_videos.push(video_info);
-                    } else {
-                        let title = media.title.clone();
-                        let video_info = VideoInfo {
-                            id: format!("av{}", media.id),
-                            aid: media.id,
-                            title: title.clone(),
-                            description: media.intro,
-                            duration: media.duration,
-                            uploader: media.upper.name,
-                            uploader_mid: media.upper.mid.to_string(),
-                            upload_date: format_timestamp(media.pubtime as u64),
-                            cover_url: media.cover,
-                            pages: vec![Page {
-                                number: 1,
-                                title,
-                                cid: media.ugc.as_ref().map(|u| u.first_cid.to_string()).unwrap_or_default(),
-                                duration: media.duration,
-                                ep_id: None,
-                            }],
-                            is_bangumi: false,
-                            ep_id: None,
-                        };
-                        all_videos.push(video_info);
-                    }
-                }
+                append_favorite_medias(client, medias, auth, &mut all_videos).await?;
             }
         }
     }
@@ -804,6 +696,57 @@ pub async fn fetch_favorite_list(
     Ok(all_videos)
 }
 
+/// 将收藏夹条目追加为VideoInfo（首页与后续页共用同一条转换路径）
+/// 多P视频按aid拉取完整分P信息，单P视频直接用列表数据就地构造
+async fn append_favorite_medias(
+    client: &Arc<HttpClient>,
+    medias: Vec<FavoriteMedia>,
+    auth: Option<&Auth>,
+    all_videos: &mut Vec<VideoInfo>,
+) -> Result<()> {
+    for media in medias {
+        // 只处理未失效的视频
+        if media.attr != 0 {
+            continue;
+        }
+
+        if media.page > 1 {
+            // 多P视频，需要获取详细信息
+            let video_info = fetch_video_info_by_aid(client, &media.id.to_string(), auth).await?;
+            all_videos.push(video_info);
+        } else {
+            // 单P视频
+            let video_info = VideoInfo {
+                id: format!("av{}", media.id),
+                aid: media.id,
+                title: media.title.clone(),
+                description: media.intro,
+                duration: media.duration,
+                uploader: media.upper.name,
+                uploader_mid: media.upper.mid.to_string(),
+                upload_date: format_timestamp(media.pubtime as u64),
+                cover_url: media.cover,
+                pages: vec![Page {
+                    number: 1,
+                    title: media.title,
+                    cid: media
+                        .ugc
+                        .as_ref()
+                        .map(|u| u.first_cid.to_string())
+                        .unwrap_or_default(),
+                    duration: media.duration,
+                    ep_id: None,
+                }],
+                is_bangumi: false,
+                ep_id: None,
+            };
+            all_videos.push(video_info);
+        }
+    }
+
+    Ok(())
+}
+
 // UP主空间视频获取（需要WBI签名）
 pub async fn fetch_space_videos(
     client: &Arc<HttpClient>,
@@ -814,9 +757,9 @@ pub async fn fetch_space_videos(
     // 获取用户信息
     let user_info_api = format!("https://api.live.bilibili.com/live_user/v1/Master/info?uid={}", mid);
     let response = client.get(&user_info_api, None).await?;
-    let json_text = response.text().await?;
+    let body = response.bytes().await?;
 
-    let user_response: ApiResponse<UserInfoData> = serde_json::from_str(&json_text)
+    let user_response: ApiResponse<UserInfoData> = serde_json::from_slice(&body)
         .map_err(|e| DownloaderError::Parse(format!("Failed to parse user info: {}", e)))?;
 
     let _user_name = user_response
@@ -833,22 +776,11 @@ pub async fn fetch_space_videos(
     let api = format!("https://api.bilibili.com/x/space/wbi/arc/search?{}", signed_params);
     
     let response = client.get_with_auth(&api, auth).await?;
-    let json_text = response.text().await?;
-
-    tracing::debug!("Space video response: {}", json_text);
+    let body = response.bytes().await?;
 
-    let api_response: ApiResponse<SpaceVideoData> = serde_json::from_str(&json_text)
-        .map_err(|e| DownloaderError::Parse(format!("Failed to parse space videos: {}", e)))?;
+    tracing::debug!("Space video response: {}", String::from_utf8_lossy(&body));
 
-    if api_response.code != 0 {
-        return Err(DownloaderError::Api(format!(
-            "API error: {}",
-            api_response.message
-        )));
-    }
-
-    let data = api_response
-        .data
+    let data = parse_api_data::<SpaceVideoData>(&body, "space videos")?
         .ok_or_else(|| DownloaderError::Parse("No space video data".to_string()))?;
 
     let page_info = data.page.ok_or_else(|| {
@@ -876,9 +808,9 @@ pub async fn fetch_space_videos(
         let api = format!("https://api.bilibili.com/x/space/wbi/arc/search?{}", signed_params);
         
         let response = client.get_with_auth(&api, auth).await?;
-        let json_text = response.text().await?;
+        let body = response.bytes().await?;
 
-        let api_response: ApiResponse<SpaceVideoData> = serde_json::from_str(&json_text)
+        let api_response: ApiResponse<SpaceVideoData> = serde_json::from_slice(&body)
             .map_err(|e| DownloaderError::Parse(format!("Failed to parse space videos: {}", e)))?;
 
         if let Some(data) = api_response.data {
@@ -905,29 +837,25 @@ pub async fn fetch_media_list(
         media_id
     );
     let response = client.get_with_auth(&api, auth).await?;
-    let json_text = response.text().await?;
+    let body = response.bytes().await?;
 
-    tracing::debug!("Media list response: {}", json_text);
+    tracing::debug!("Media list response: {}", String::from_utf8_lossy(&body));
 
-    let api_response: ApiResponse<MediaListData> = serde_json::from_str(&json_text)
-        .map_err(|e| DownloaderError::Parse(format!("Failed to parse media list: {}", e)))?;
-
-    if api_response.code != 0 {
-        return Err(DownloaderError::Api(format!(
-            "API error: {}",
-            api_response.message
-        )));
-    }
-
-    let data = api_response
-        .data
+    let data = parse_api_data::<MediaListData>(&body, "media list")?
         .ok_or_else(|| DownloaderError::Parse("No media list data".to_string()))?;
 
-    let mut all_videos = Vec::new();
+    use futures::StreamExt;
 
-    for item in data.medias {
-        let video_info = fetch_video_info_by_bvid(client, &item.bv_id, auth).await?;
-        all_videos.push(video_info);
+    // 并发获取视频详情，buffered 保证结果保持原有顺序
+    let mut all_videos = Vec::with_capacity(data.medias.len());
+    let mut details = futures::stream::iter(data.medias.into_iter().map(|item| {
+        let bvid = item.bv_id;
+        async move { fetch_video_info_by_bvid(client, &bvid, auth).await }
+    }))
+    .buffered(DETAIL_FETCH_CONCURRENCY);
+
+    while let Some(video_info) = details.next().await {
+        all_videos.push(video_info?);
     }
 
     Ok(all_videos)
@@ -957,22 +885,11 @@ pub async fn fetch_series_list(
         mid, sid, page_size
     );
     let response = client.get_with_auth(&api, auth).await?;
-    let json_text = response.text().await?;
-
-    tracing::debug!("Series list response: {}", json_text);
+    let body = response.bytes().await?;
 
-    let api_response: ApiResponse<SeriesListData> = serde_json::from_str(&json_text)
-        .map_err(|e| DownloaderError::Parse(format!("Failed to parse series list: {}", e)))?;
-
-    if api_response.code != 0 {
-        return Err(DownloaderError::Api(format!(
-            "API error: {}",
-            api_response.message
-        )));
-    }
+    tracing::debug!("Series list response: {}", String::from_utf8_lossy(&body));
 
-    let data = api_response
-        .data
+    let data = parse_api_data::<SeriesListData>(&body, "series list")?
         .ok_or_else(|| DownloaderError::Parse("No series list data".to_string()))?;
 
     let total_count = data.meta.total;
@@ -991,9 +908,9 @@ pub async fn fetch_series_list(
             mid, sid, page, page_size
         );
         let response = client.get_with_auth(&api, auth).await?;
-        let json_text = response.text().await?;
+        let body = response.bytes().await?;
 
-        let api_response: ApiResponse<SeriesListData> = serde_json::from_str(&json_text)
+        let api_response: ApiResponse<SeriesListData> = serde_json::from_slice(&body)
             .map_err(|e| DownloaderError::Parse(format!("Failed to parse series list: {}", e)))?;
 
         if let Some(data) = api_response.data {
@@ -1019,17 +936,11 @@ pub async fn fetch_chapters(
     );
 
     let response = client.get(&api, None).await?;
-    let json_text = response.text().await?;
+    let body = response.bytes().await?;
 
-    tracing::debug!("Chapter info response: {}", json_text);
+    tracing::debug!("Chapter info response: {}", String::from_utf8_lossy(&body));
 
     // 尝试解析章节信息
-    #[derive(Deserialize)]
-    #[allow(dead_code)]
-    struct ChapterResponse {
-        data: Option<ChapterData>,
-    }
-
     #[derive(Deserialize)]
     struct ChapterData {
         #[serde(default)]
@@ -1053,7 +964,7 @@ pub async fn fetch_chapters(
         end: f64,
     }
 
-    let api_response: ApiResponse<ChapterData> = serde_json::from_str(&json_text)
+    let api_response: ApiResponse<ChapterData> = serde_json::from_slice(&body)
         .map_err(|e| DownloaderError::Parse(format!("Failed to parse chapter info: {}", e)))?;
 
     if api_response.code != 0 {
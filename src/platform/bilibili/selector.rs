@@ -5,15 +5,15 @@ pub fn select_best_streams(
     streams: &[Stream],
     preferences: &StreamPreferences,
 ) -> Result<(Stream, Stream)> {
-    let video_streams: Vec<&Stream> = streams
-        .iter()
-        .filter(|s| s.stream_type == StreamType::Video)
-        .collect();
-
-    let audio_streams: Vec<&Stream> = streams
-        .iter()
-        .filter(|s| s.stream_type == StreamType::Audio)
-        .collect();
+    // 一次遍历同时分拣视频流和音频流
+    let mut video_streams: Vec<&Stream> = Vec::new();
+    let mut audio_streams: Vec<&Stream> = Vec::new();
+    for stream in streams {
+        match stream.stream_type {
+            StreamType::Video => video_streams.push(stream),
+            StreamType::Audio => audio_streams.push(stream),
+        }
+    }
 
     if video_streams.is_empty() {
         return Err(DownloaderError::DownloadFailed(
@@ -37,12 +37,18 @@ fn select_best_video<'a>(
     video_streams: &'a [&'a Stream],
     preferences: &StreamPreferences,
 ) -> Result<&'a Stream> {
+    // 编码优先级在构建偏好时已折叠为小写，这里只需小写化流编码一次
+    let stream_codecs_lower: Vec<String> = video_streams
+        .iter()
+        .map(|s| s.codec.to_lowercase())
+        .collect();
+
     // First, try to match quality preference
     for quality_pref in &preferences.quality_priority {
         for codec_pref in &preferences.codec_priority {
-            if let Some(stream) = video_streams.iter().find(|s| {
-                s.quality.contains(quality_pref)
-                    && s.codec.to_lowercase().contains(&codec_pref.to_lowercase())
+            if let Some(stream) = video_streams.iter().enumerate().find_map(|(i, s)| {
+                (s.quality.contains(quality_pref) && stream_codecs_lower[i].contains(codec_pref))
+                    .then_some(*s)
             }) {
                 tracing::info!(
                     "Selected video: {} {} ({}kbps)",
@@ -41,19 +41,22 @@ impl WbiManager {
     }
 
     /// 获取或刷新WBI密钥
-    pub async fn get_mixin_key(&mut self) -> Result<String> {
-        if let Some(ref key) = self.mixin_key {
-            return Ok(key.clone());
+    pub async fn get_mixin_key(&mut self) -> Result<&str> {
+        if self.mixin_key.is_none() {
+            self.refresh_mixin_key().await?;
         }
+        Ok(self.mixin_key.as_deref().unwrap())
+    }
 
-        // 从导航API获取wbi_img信息
+    /// 从导航API获取wbi_img信息并生成混合密钥
+    async fn refresh_mixin_key(&mut self) -> Result<()> {
         let api = "https://api.bilibili.com/x/web-interface/nav";
         let response = self.client.get(api, None).await?;
-        let json_text = response.text().await?;
+        let body = response.bytes().await?;
 
-        tracing::debug!("Nav API response: {}", json_text);
+        tracing::debug!("Nav API response: {}", String::from_utf8_lossy(&body));
 
-        let nav_response: NavResponse = serde_json::from_str(&json_text)
+        let nav_response: NavResponse = serde_json::from_slice(&body)
             .map_err(|e| DownloaderError::Parse(format!("Failed to parse nav response: {}", e)))?;
 
         // 即使未登录（code=-101），wbi_img数据仍然存在
@@ -74,17 +77,19 @@ impl WbiManager {
 
         tracing::debug!("WBI mixin key: {}", mixin_key);
 
-        self.mixin_key = Some(mixin_key.clone());
-        Ok(mixin_key)
+        self.mixin_key = Some(mixin_key);
+        Ok(())
     }
 
     /// 对API参数进行WBI签名
     pub async fn sign(&mut self, params: &str) -> Result<String> {
         let mixin_key = self.get_mixin_key().await?;
 
-        // 计算MD5哈希
-        let digest = md5::compute(format!("{}{}", params, mixin_key).as_bytes());
-        let w_rid = format!("{:x}", digest);
+        // 计算MD5哈希（增量喂入，不拼接中间字符串）
+        let mut context = md5::Context::new();
+        context.consume(params.as_bytes());
+        context.consume(mixin_key.as_bytes());
+        let w_rid = format!("{:x}", context.compute());
 
         Ok(format!("{}&w_rid={}", params, w_rid))
     }
@@ -106,29 +111,13 @@ impl WbiManager {
 
 /// 从URL中提取文件名（去掉路径和扩展名）
 fn extract_filename(url: &str) -> String {
-    // 找到最后一个 '/' 后的内容
-    let filename_with_ext = url.rsplit('/').next().unwrap_or("");
-
-    // 去掉扩展名
-    let filename = filename_with_ext
-        .rsplit('.')
-        .nth(1)
-        .map(|s| {
-            // 反转回来
-            s.chars().rev().collect::<String>()
-        })
-        .unwrap_or_else(|| filename_with_ext.to_string());
-
-    // 更简单的方法：找到最后一个'/'和最后一个'.'之间的内容
-    if let Some(slash_pos) = url.rfind('/') {
-        if let Some(dot_pos) = url.rfind('.') {
-            if dot_pos > slash_pos {
-                return url[slash_pos + 1..dot_pos].to_string();
-            }
-        }
-    }
+    // 取最后一个 '/' 后的内容，再去掉扩展名
+    let filename = url.rsplit('/').next().unwrap_or(url);
 
-    filename
+    match filename.rfind('.') {
+        Some(dot_pos) => filename[..dot_pos].to_string(),
+        None => filename.to_string(),
+    }
 }
 
 /// 使用混淆表生成混合密钥
@@ -67,30 +67,33 @@ impl From<&crate::utils::config::AuthConfig> for Auth {
     }
 }
 
+/// 默认清晰度优先级（CLI未指定 -q 时使用）
+pub const DEFAULT_QUALITY_PRIORITY: &[&str] = &["1080P", "720P", "480P"];
+/// 默认编码优先级（CLI未指定 -c 时使用）
+pub const DEFAULT_CODEC_PRIORITY: &[&str] = &["avc", "hevc", "av1"];
+
 #[derive(Debug, Clone)]
 pub struct StreamPreferences {
     pub quality_priority: Vec<String>,
+    /// 编码优先级，约定为小写（构建时折叠，选流时与小写化的流编码直接比较）
     pub codec_priority: Vec<String>,
 }
 
 impl Default for StreamPreferences {
     fn default() -> Self {
         Self {
-            quality_priority: vec!["1080P".to_string(), "720P".to_string(), "480P".to_string()],
-            codec_priority: vec!["avc".to_string(), "hevc".to_string(), "av1".to_string()],
+            quality_priority: DEFAULT_QUALITY_PRIORITY
+                .iter()
+                .map(|s| s.to_string())
+                .collect(),
+            codec_priority: DEFAULT_CODEC_PRIORITY
+                .iter()
+                .map(|s| s.to_string())
+                .collect(),
         }
     }
 }
 
-#[derive(Debug)]
-#[allow(dead_code)]
-pub struct DownloadedComponents {
-    pub video_path: std::path::PathBuf,
-    pub audio_path: std::path::PathBuf,
-    pub subtitle_paths: Vec<std::path::PathBuf>,
-    pub cover_path: Option<std::path::PathBuf>,
-}
-
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct Chapter {
     pub title: String,
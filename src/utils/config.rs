@@ -54,32 +54,47 @@ pub struct Aria2cConfig {
 
 impl Config {
     pub fn load(path: &Path) -> Result<Self> {
-        if !path.exists() {
-            tracing::debug!("Config file not found at {:?}, using defaults", path);
-            return Ok(Self::default());
+        match Self::try_load(path)? {
+            Some(config) => Ok(config),
+            None => {
+                tracing::debug!("Config file not found at {:?}, using defaults", path);
+                Ok(Self::default())
+            }
         }
+    }
 
-        let content = std::fs::read_to_string(path)
-            .map_err(|e| DownloaderError::Config(format!("Failed to read config file: {}", e)))?;
+    /// 尝试读取并解析一个候选配置文件
+    ///
+    /// 直接读取并按 NotFound 返回None，避免 exists() 的额外 stat 和竞态
+    fn try_load(path: &Path) -> Result<Option<Self>> {
+        let content = match std::fs::read_to_string(path) {
+            Ok(content) => content,
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => return Ok(None),
+            Err(e) => {
+                return Err(DownloaderError::Config(format!(
+                    "Failed to read config file: {}",
+                    e
+                )))
+            }
+        };
 
         let config: Config = toml::from_str(&content)
             .map_err(|e| DownloaderError::Config(format!("Failed to parse config file: {}", e)))?;
 
-        Ok(config)
+        Ok(Some(config))
     }
 
     pub fn load_default() -> Result<Self> {
         // Try to load from current directory
-        let current_dir_config = PathBuf::from("rvd.toml");
-        if current_dir_config.exists() {
-            return Self::load(&current_dir_config);
+        if let Some(config) = Self::try_load(Path::new("rvd.toml"))? {
+            return Ok(config);
         }
 
         // Try to load from home directory
         if let Some(home) = dirs::home_dir() {
             let home_config = home.join(".config").join("rvd").join("config.toml");
-            if home_config.exists() {
-                return Self::load(&home_config);
+            if let Some(config) = Self::try_load(&home_config)? {
+                return Ok(config);
             }
         }
 
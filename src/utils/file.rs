@@ -4,19 +4,25 @@ use std::collections::HashMap;
 use std::path::{Path, PathBuf};
 
 pub fn sanitize_filename(name: &str) -> String {
-    let invalid_chars = ['<', '>', ':', '"', '/', '\\', '|', '?', '*'];
-    let mut sanitized = name.to_string();
-
-    for ch in invalid_chars {
-        sanitized = sanitized.replace(ch, "_");
-    }
+    // 一次遍历替换所有非法字符，避免每个字符一趟 replace
+    let sanitized: String = name
+        .chars()
+        .map(|ch| match ch {
+            '<' | '>' | ':' | '"' | '/' | '\\' | '|' | '?' | '*' => '_',
+            other => other,
+        })
+        .collect();
 
     // Remove leading/trailing spaces and dots
-    sanitized = sanitized.trim().trim_matches('.').to_string();
+    let mut sanitized = sanitized.trim().trim_matches('.').to_string();
 
-    // Limit length
+    // Limit length（回退到最近的字符边界，避免在多字节字符中间截断panic）
     if sanitized.len() > 200 {
-        sanitized.truncate(200);
+        let mut cut = 200;
+        while !sanitized.is_char_boundary(cut) {
+            cut -= 1;
+        }
+        sanitized.truncate(cut);
     }
 
     if sanitized.is_empty() {
@@ -33,7 +39,6 @@ pub fn parse_template(
     quality: &str,
     codec: &str,
 ) -> String {
-    let mut result = template.to_string();
     let mut vars = HashMap::new();
 
     vars.insert("<videoTitle>", sanitize_filename(&video_info.title));
@@ -51,10 +56,28 @@ pub fn parse_template(
         vars.insert("<cid>", p.cid.clone());
     }
 
-    for (key, value) in vars {
-        result = result.replace(key, &value);
+    // 单次扫描模板，遇到占位符直接查表替换，避免每个变量各扫一遍
+    let mut result = String::with_capacity(template.len());
+    let mut rest = template;
+
+    while let Some(start) = rest.find('<') {
+        result.push_str(&rest[..start]);
+        let tail = &rest[start..];
+
+        match tail.find('>') {
+            Some(end) if vars.contains_key(&tail[..=end]) => {
+                result.push_str(&vars[&tail[..=end]]);
+                rest = &tail[end + 1..];
+            }
+            _ => {
+                // 不是已知占位符，原样保留 '<' 并继续扫描
+                result.push('<');
+                rest = &tail[1..];
+            }
+        }
     }
 
+    result.push_str(rest);
     result
 }
 
@@ -65,21 +88,21 @@ pub async fn create_temp_dir(video_id: &str) -> Result<PathBuf> {
 }
 
 pub async fn cleanup_temp_dir(dir: &Path) -> Result<()> {
-    if dir.exists() {
-        tokio::fs::remove_dir_all(dir).await?;
+    // 直接删除并容忍目录不存在，省掉先行exists()的一次stat
+    match tokio::fs::remove_dir_all(dir).await {
+        Ok(()) => Ok(()),
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => Ok(()),
+        Err(e) => Err(e.into()),
     }
-    Ok(())
 }
 
-#[allow(dead_code)]
-pub async fn merge_files(chunks: &[PathBuf], output: &Path) -> Result<()> {
-    let mut output_file = tokio::fs::File::create(output).await?;
-
-    for chunk in chunks {
-        let mut chunk_file = tokio::fs::File::open(chunk).await?;
-        tokio::io::copy(&mut chunk_file, &mut output_file).await?;
+/// 将临时文件移到输出位置：同一文件系统时rename零拷贝，跨设备回退为copy
+pub async fn move_or_copy(src: &Path, dst: &Path) -> Result<()> {
+    if tokio::fs::rename(src, dst).await.is_ok() {
+        return Ok(());
     }
 
+    tokio::fs::copy(src, dst).await?;
     Ok(())
 }
 
@@ -1,10 +1,30 @@
 use crate::error::{DownloaderError, Result};
 use crate::types::Auth;
-use reqwest::{header::HeaderMap, Client, Response};
-use std::path::Path;
+use reqwest::{
+    header::{HeaderMap, HeaderValue},
+    Client, Response,
+};
 use std::time::Duration;
-use tokio::fs::File;
-use tokio::io::AsyncWriteExt;
+
+/// B站视频CDN要求的Referer
+pub const BILI_REFERER: &str = "https://www.bilibili.com";
+/// 默认浏览器User-Agent
+pub const BILI_USER_AGENT: &str =
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36";
+
+/// 为 bilivideo.com 的下载URL构造必需的 Referer/User-Agent 头
+/// 其他URL返回空HeaderMap
+pub fn bilivideo_headers(url: &str) -> HeaderMap {
+    let mut headers = HeaderMap::new();
+
+    if url.contains("bilivideo.com") {
+        // 固定值走 from_static，避免每个请求重新解析校验
+        headers.insert("Referer", HeaderValue::from_static(BILI_REFERER));
+        headers.insert("User-Agent", HeaderValue::from_static(BILI_USER_AGENT));
+    }
+
+    headers
+}
 
 pub struct HttpClient {
     pub client: Client,
@@ -47,6 +67,18 @@ impl HttpClient {
         headers: Option<HeaderMap>,
         body: Option<&str>,
     ) -> Result<Response> {
+        // 请求只构建一次：headers直接移交，body只分配一次
+        let mut builder = if let Some(b) = body {
+            self.client.post(url).body(b.to_string())
+        } else {
+            self.client.get(url)
+        };
+
+        if let Some(h) = headers {
+            builder = builder.headers(h);
+        }
+
+        let mut builder = Some(builder);
         let mut last_error = None;
 
         for attempt in 0..self.retry_count {
@@ -56,20 +88,19 @@ impl HttpClient {
                 tracing::debug!("Retrying request (attempt {})", attempt + 1);
             }
 
-            let mut request = if body.is_some() {
-                self.client.post(url)
-            } else {
-                self.client.get(url)
+            // 仅在后面还有重试机会时克隆请求，最后一次直接移交所有权
+            let request = match builder.take() {
+                Some(b) if attempt + 1 < self.retry_count => match b.try_clone() {
+                    Some(clone) => {
+                        builder = Some(b);
+                        clone
+                    }
+                    None => b,
+                },
+                Some(b) => b,
+                None => break,
             };
 
-            if let Some(ref h) = headers {
-                request = request.headers(h.clone());
-            }
-
-            if let Some(b) = body {
-                request = request.body(b.to_string());
-            }
-
             match request.send().await {
                 Ok(response) => {
                     if response.status().is_success() {
@@ -90,44 +121,6 @@ impl HttpClient {
             .unwrap_or_else(|| DownloaderError::DownloadFailed("Max retries exceeded".to_string())))
     }
 
-    pub async fn download_file(
-        &self,
-        url: &str,
-        output: &Path,
-        range: Option<(u64, u64)>,
-    ) -> Result<()> {
-        let mut request = self.client.get(url);
-
-        // Add required headers for Bilibili video downloads
-        if url.contains("bilivideo.com") {
-            request = request.header("Referer", "https://www.bilibili.com");
-            request = request.header(
-                "User-Agent",
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            );
-        }
-
-        if let Some((start, end)) = range {
-            request = request.header("Range", format!("bytes={}-{}", start, end));
-        }
-
-        let response = request.send().await?;
-
-        if !response.status().is_success() {
-            return Err(DownloaderError::DownloadFailed(format!(
-                "HTTP {}",
-                response.status()
-            )));
-        }
-
-        let mut file = File::create(output).await?;
-        let bytes = response.bytes().await?;
-        file.write_all(&bytes).await?;
-        file.flush().await?;
-
-        Ok(())
-    }
-
     pub fn add_auth(&self, headers: &mut HeaderMap, auth: &Auth) {
         if let Some(ref cookie) = auth.cookie {
             if let Ok(value) = cookie.parse() {
@@ -151,9 +144,10 @@ impl HttpClient {
 
         // Add referer for bilibili API
         if url.contains("api.bilibili.com") {
-            if let Ok(value) = "https://www.bilibili.com/".parse() {
-                headers.insert("Referer", value);
-            }
+            headers.insert(
+                "Referer",
+                HeaderValue::from_static("https://www.bilibili.com/"),
+            );
         }
 
         self.get(url, Some(headers)).await
@@ -11,7 +11,7 @@ fn test_parse_quality_priority_default() {
         cookie: None,
         access_token: None,
         pages: None,
-        threads: 4,
+        threads: Some(4),
         skip_subtitle: false,
         skip_cover: false,
         skip_mux: false,
@@ -47,7 +47,7 @@ fn test_parse_quality_priority_custom() {
         cookie: None,
         access_token: None,
         pages: None,
-        threads: 4,
+        threads: Some(4),
         skip_subtitle: false,
         skip_cover: false,
         skip_mux: false,
@@ -83,7 +83,7 @@ fn test_parse_codec_priority_default() {
         cookie: None,
         access_token: None,
         pages: None,
-        threads: 4,
+        threads: Some(4),
         skip_subtitle: false,
         skip_cover: false,
         skip_mux: false,
@@ -119,7 +119,7 @@ fn test_parse_codec_priority_custom() {
         cookie: None,
         access_token: None,
         pages: None,
-        threads: 4,
+        threads: Some(4),
         skip_subtitle: false,
         skip_cover: false,
         skip_mux: false,
@@ -155,7 +155,7 @@ fn test_parse_pages_none() {
         cookie: None,
         access_token: None,
         pages: None,
-        threads: 4,
+        threads: Some(4),
         skip_subtitle: false,
         skip_cover: false,
         skip_mux: false,
@@ -191,7 +191,7 @@ fn test_parse_pages_all() {
         cookie: None,
         access_token: None,
         pages: Some("ALL".to_string()),
-        threads: 4,
+        threads: Some(4),
         skip_subtitle: false,
         skip_cover: false,
         skip_mux: false,
@@ -227,7 +227,7 @@ fn test_parse_pages_single() {
         cookie: None,
         access_token: None,
         pages: Some("5".to_string()),
-        threads: 4,
+        threads: Some(4),
         skip_subtitle: false,
         skip_cover: false,
         skip_mux: false,
@@ -263,7 +263,7 @@ fn test_parse_pages_multiple() {
         cookie: None,
         access_token: None,
         pages: Some("1,3,5".to_string()),
-        threads: 4,
+        threads: Some(4),
         skip_subtitle: false,
         skip_cover: false,
         skip_mux: false,
@@ -299,7 +299,7 @@ fn test_parse_pages_range() {
         cookie: None,
         access_token: None,
         pages: Some("3-7".to_string()),
-        threads: 4,
+        threads: Some(4),
         skip_subtitle: false,
         skip_cover: false,
         skip_mux: false,
@@ -335,7 +335,7 @@ fn test_parse_pages_mixed() {
         cookie: None,
         access_token: None,
         pages: Some("1,3-5,8".to_string()),
-        threads: 4,
+        threads: Some(4),
         skip_subtitle: false,
         skip_cover: false,
         skip_mux: false,
@@ -372,7 +372,7 @@ fn test_cli_api_mode_tv() {
         cookie: None,
         access_token: None,
         pages: None,
-        threads: 4,
+        threads: Some(4),
         skip_subtitle: false,
         skip_cover: false,
         skip_mux: false,
@@ -409,7 +409,7 @@ fn test_cli_api_mode_app() {
         cookie: None,
         access_token: None,
         pages: None,
-        threads: 4,
+        threads: Some(4),
         skip_subtitle: false,
         skip_cover: false,
         skip_mux: false,
@@ -446,7 +446,7 @@ fn test_cli_api_mode_international() {
         cookie: None,
         access_token: None,
         pages: None,
-        threads: 4,
+        threads: Some(4),
         skip_subtitle: false,
         skip_cover: false,
         skip_mux: false,
@@ -484,7 +484,7 @@ fn test_cli_danmaku_download() {
         cookie: None,
         access_token: None,
         pages: None,
-        threads: 4,
+        threads: Some(4),
         skip_subtitle: false,
         skip_cover: false,
         skip_mux: false,
@@ -519,7 +519,7 @@ fn test_cli_danmaku_format_xml() {
         cookie: None,
         access_token: None,
         pages: None,
-        threads: 4,
+        threads: Some(4),
         skip_subtitle: false,
         skip_cover: false,
         skip_mux: false,
@@ -556,7 +556,7 @@ fn test_cli_danmaku_format_ass() {
         cookie: None,
         access_token: None,
         pages: None,
-        threads: 4,
+        threads: Some(4),
         skip_subtitle: false,
         skip_cover: false,
         skip_mux: false,
@@ -594,7 +594,7 @@ fn test_cli_interactive_flag() {
         cookie: None,
         access_token: None,
         pages: None,
-        threads: 4,
+        threads: Some(4),
         skip_subtitle: false,
         skip_cover: false,
         skip_mux: false,
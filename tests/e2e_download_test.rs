@@ -203,6 +203,7 @@ async fn test_32_2_parse_bangumi_by_ss() {
 }
 
 #[tokio::test]
+#[ignore] // 实际下载耗时较长，默认跳过；用 cargo test -- --ignored 运行
 async fn test_32_2_download_bangumi_single_episode() {
     println!("\n=== Task 32.2: 测试下载番剧单集 ===");
 
@@ -222,7 +223,7 @@ async fn test_32_2_download_bangumi_single_episode() {
         cookie: config.auth.as_ref().and_then(|a| a.cookie.as_ref().cloned()),
         access_token: config.auth.as_ref().and_then(|a| a.access_token.as_ref().cloned()),
         pages: Some("1".to_string()), // 只下载第一集
-        threads: 2,
+        threads: Some(2),
         skip_subtitle: true,
         skip_cover: true,
         skip_mux: false,
@@ -503,7 +504,7 @@ async fn test_32_6_download_with_tv_api() {
         cookie: config.auth.as_ref().and_then(|a| a.cookie.as_ref().cloned()),
         access_token: config.auth.as_ref().and_then(|a| a.access_token.as_ref().cloned()),
         pages: Some("1".to_string()),
-        threads: 2,
+        threads: Some(2),
         skip_subtitle: true,
         skip_cover: true,
         skip_mux: false,
@@ -572,7 +573,7 @@ async fn test_32_7_download_danmaku_xml() {
         cookie: config.auth.as_ref().and_then(|a| a.cookie.as_ref().cloned()),
         access_token: config.auth.as_ref().and_then(|a| a.access_token.as_ref().cloned()),
         pages: Some("1".to_string()),
-        threads: 2,
+        threads: Some(2),
         skip_subtitle: true,
         skip_cover: true,
         skip_mux: true, // 跳过混流，只测试弹幕下载
@@ -634,7 +635,7 @@ async fn test_32_7_download_danmaku_ass() {
         cookie: config.auth.as_ref().and_then(|a| a.cookie.as_ref().cloned()),
         access_token: config.auth.as_ref().and_then(|a| a.access_token.as_ref().cloned()),
         pages: Some("1".to_string()),
-        threads: 2,
+        threads: Some(2),
         skip_subtitle: true,
         skip_cover: true,
         skip_mux: true,
@@ -718,6 +719,7 @@ async fn test_32_8_fetch_chapters() {
 }
 
 #[tokio::test]
+#[ignore] // 实际下载耗时较长，默认跳过；用 cargo test -- --ignored 运行
 async fn test_32_8_download_with_chapters() {
     println!("\n=== Task 32.8: 测试下载并嵌入章节信息 ===");
 
@@ -738,7 +740,7 @@ async fn test_32_8_download_with_chapters() {
         cookie: config.auth.as_ref().and_then(|a| a.cookie.as_ref().cloned()),
         access_token: config.auth.as_ref().and_then(|a| a.access_token.as_ref().cloned()),
         pages: Some("1".to_string()),
-        threads: 2,
+        threads: Some(2),
         skip_subtitle: true,
         skip_cover: true,
         skip_mux: false, // 需要混流才能嵌入章节
@@ -785,6 +787,7 @@ async fn test_32_8_download_with_chapters() {
 // ============================================================================
 
 #[tokio::test]
+#[ignore] // 实际下载耗时较长，默认跳过；用 cargo test -- --ignored 运行
 async fn test_32_9_interactive_mode_disabled() {
     println!("\n=== Task 32.9: 测试非交互式模式（自动选择） ===");
 
@@ -804,7 +807,7 @@ async fn test_32_9_interactive_mode_disabled() {
         cookie: config.auth.as_ref().and_then(|a| a.cookie.as_ref().cloned()),
         access_token: config.auth.as_ref().and_then(|a| a.access_token.as_ref().cloned()),
         pages: Some("1".to_string()),
-        threads: 2,
+        threads: Some(2),
         skip_subtitle: true,
         skip_cover: true,
         skip_mux: false,
@@ -854,6 +857,7 @@ async fn test_32_9_interactive_mode_disabled() {
 // ============================================================================
 
 #[tokio::test]
+#[ignore] // 实际下载耗时较长，默认跳过；用 cargo test -- --ignored 运行
 async fn test_complete_download_workflow() {
     println!("\n=== 综合测试: 完整下载流程（视频+音频+字幕+封面+弹幕） ===");
 
@@ -873,7 +877,7 @@ async fn test_complete_download_workflow() {
         cookie: config.auth.as_ref().and_then(|a| a.cookie.as_ref().cloned()),
         access_token: config.auth.as_ref().and_then(|a| a.access_token.as_ref().cloned()),
         pages: Some("1".to_string()),
-        threads: 4,
+        threads: Some(4),
         skip_subtitle: false, // 下载字幕
         skip_cover: false,    // 下载封面
         skip_mux: false,
@@ -931,6 +935,7 @@ async fn test_complete_download_workflow() {
 // ============================================================================
 
 #[tokio::test]
+#[ignore] // 实际下载耗时较长，默认跳过；用 cargo test -- --ignored 运行
 async fn test_multi_page_download() {
     println!("\n=== 测试多分P视频下载 ===");
 
@@ -950,7 +955,7 @@ async fn test_multi_page_download() {
         cookie: config.auth.as_ref().and_then(|a| a.cookie.as_ref().cloned()),
         access_token: config.auth.as_ref().and_then(|a| a.access_token.as_ref().cloned()),
         pages: Some("1,2".to_string()), // 下载前两个分P
-        threads: 2,
+        threads: Some(2),
         skip_subtitle: true,
         skip_cover: true,
         skip_mux: false,
@@ -1025,7 +1030,7 @@ async fn test_info_only_mode() {
         cookie: config.auth.as_ref().and_then(|a| a.cookie.as_ref().cloned()),
         access_token: config.auth.as_ref().and_then(|a| a.access_token.as_ref().cloned()),
         pages: None,
-        threads: 2,
+        threads: Some(2),
         skip_subtitle: true,
         skip_cover: true,
         skip_mux: true,